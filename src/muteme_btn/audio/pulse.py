@@ -82,7 +82,8 @@ class PulseAudioBackend:
             source_name: Name of source to check, or None for default source
 
         Returns:
-            True if source is muted, False otherwise
+            True if source is muted, False otherwise (pulsectl's 0/1 ``mute``
+            value is normalised to bool)
         """
         try:
             # Use specified source, configured source, or get default source
@@ -143,12 +143,33 @@ class AppConfig(BaseModel):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         try:
-            import toml
+            content = config_path.read_text(encoding="utf-8")
+        except Exception as e:
+            raise ValueError(f"Invalid configuration file {config_path}: {e}") from e
+
+        return cls.from_toml_str(content, source=str(config_path))
+
+    @classmethod
+    def from_toml_str(cls, content: str, source: str = "<string>") -> "AppConfig":
+        """Load configuration from TOML text.
+
+        Args:
+            content: TOML document to parse
+            source: Where the document came from, used in error messages
 
-            config_data = toml.load(config_path)
+        Returns:
+            AppConfig instance
+
+        Raises:
+            ValueError: If the TOML is malformed or fails validation
+        """
+        try:
+            import tomllib
+
+            config_data = tomllib.loads(content)
             return cls(**config_data)
         except Exception as e:
-            raise ValueError(f"Invalid configuration file {config_path}: {e}") from e
+            raise ValueError(f"Invalid configuration file {source}: {e}") from e
 
     def to_toml_file(self, config_path: Path) -> None:
         """Save configuration to a TOML file.
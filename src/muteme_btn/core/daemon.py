@@ -49,12 +49,11 @@ class MuteMeDaemon:
         # LED controller will be created after device is connected
         self.led_controller = led_controller
 
+        # The running flag is only read and written on the event loop, with no await
+        # between a check and its update, so it needs no lock. Signal handlers only
+        # set the shutdown event.
         self.running: bool = False
         self._shutdown_event = asyncio.Event()
-        # Lock for thread-safe access to running flag
-        # Note: Signal handlers run in the main thread, so GIL provides protection,
-        # but this lock ensures explicit synchronization for async operations
-        self._running_lock = asyncio.Lock()
 
         # Reconnect/backoff state for runtime device disconnects
         self._reconnect_initial_delay_seconds = 0.5
@@ -62,6 +61,12 @@ class MuteMeDaemon:
         self._reconnect_delay_seconds = self._reconnect_initial_delay_seconds
         self._next_reconnect_attempt_at = 0.0
 
+        # Last known mute state, so LED refreshes don't query PulseAudio every tick.
+        # The TTL bounds how long external mute changes take to reach the LED.
+        self._mute_cache_ttl_ns = 500_000_000
+        self._cached_mute_state: bool | None = None
+        self._cache_valid_until_ns = 0
+
         # Setup signal handlers
         self._setup_signal_handlers()
 
@@ -92,14 +97,13 @@ class MuteMeDaemon:
 
     async def start(self) -> None:
         """Start the daemon main loop."""
-        async with self._running_lock:
-            if self.running:
-                logger.warning("Daemon is already running")
-                return
+        if self.running:
+            logger.warning("Daemon is already running")
+            return
 
-            logger.info("Starting MuteMe daemon")
-            self.running = True
-            self._shutdown_event.clear()
+        logger.info("Starting MuteMe daemon")
+        self.running = True
+        self._shutdown_event.clear()
 
         device_connected = False
         try:
@@ -143,8 +147,7 @@ class MuteMeDaemon:
                 except Exception as cleanup_error:
                     logger.warning(f"Error cleaning up device after exception: {cleanup_error}")
         finally:
-            async with self._running_lock:
-                self.running = False
+            self.running = False
             # Ensure cleanup is called on shutdown
             self.cleanup()
             logger.info("MuteMe daemon stopped")
@@ -204,10 +207,9 @@ class MuteMeDaemon:
 
     async def stop(self) -> None:
         """Stop the daemon gracefully."""
-        async with self._running_lock:
-            if not self.running:
-                logger.debug("Daemon is not running")
-                return
+        if not self.running:
+            logger.debug("Daemon is not running")
+            return
 
         logger.info("Stopping MuteMe daemon")
         self._shutdown_event.set()
@@ -218,38 +220,24 @@ class MuteMeDaemon:
         except TimeoutError:
             logger.warning("Graceful shutdown timeout, forcing stop")
         finally:
-            async with self._running_lock:
-                self.running = False
+            self.running = False
 
     async def _main_loop(self) -> None:
         """Main daemon loop."""
-        # Use configurable poll interval and timeout from device config
+        # Use configurable poll interval and timeout from device config. The timeout
+        # only caps the pause between polls, so sleep for the shorter of the two
+        # directly instead of wrapping every sleep in asyncio.wait_for().
         poll_interval = self.device_config.poll_interval_ms / 1000.0
         poll_timeout = self.device_config.poll_timeout_ms / 1000.0
+        idle_delay = min(poll_interval, poll_timeout)
 
-        while True:
-            # Thread-safe check of running flag
-            async with self._running_lock:
-                if not self.running:
-                    break
-                running_state = self.running
-
-            if not running_state or self._shutdown_event.is_set():
-                break
-
+        while self.running and not self._shutdown_event.is_set():
             try:
                 if self.device is None or not self.device.is_connected():
                     await self._attempt_reconnect_if_needed()
 
                     # Small delay to prevent busy waiting
-                    try:
-                        await asyncio.wait_for(
-                            asyncio.sleep(poll_interval),
-                            timeout=poll_timeout,
-                        )
-                    except TimeoutError:
-                        # Continue loop if sleep times out
-                        pass
+                    await asyncio.sleep(idle_delay)
                     continue
 
                 # Process button events
@@ -259,14 +247,7 @@ class MuteMeDaemon:
                 await self._update_led_feedback()
 
                 # Small delay to prevent busy waiting
-                try:
-                    await asyncio.wait_for(
-                        asyncio.sleep(poll_interval),
-                        timeout=poll_timeout,
-                    )
-                except TimeoutError:
-                    # Continue loop if sleep times out
-                    pass
+                await asyncio.sleep(idle_delay)
 
             except asyncio.CancelledError:
                 logger.debug("Main loop cancelled")
@@ -331,7 +312,7 @@ class MuteMeDaemon:
 
             for event in events:
                 # Convert to button event
-                button_event = ButtonEvent(type=event.type, timestamp=event.timestamp)
+                button_event = ButtonEvent(type=event.type, timestamp_ns=event.timestamp_ns)
 
                 # Process through state machine
                 actions = self.state_machine.process_event(button_event)
@@ -358,6 +339,7 @@ class MuteMeDaemon:
                 current_muted = self.audio_backend.is_muted(None)
                 new_muted = not current_muted
                 self.audio_backend.set_mute_state(None, new_muted)
+                self._store_mute_state(new_muted)
 
                 # Update LED to reflect new state
                 await self._update_led_feedback()
@@ -427,13 +409,26 @@ class MuteMeDaemon:
                 logger.debug("LED controller not initialized, skipping LED feedback update")
                 return
 
-            self.led_controller.update_led_to_mute_status()
+            self.led_controller.update_led_to_mute_status(self._get_mute_state())
         except Exception as e:
             logger.error(f"Error updating LED feedback: {e}")
             # Log traceback in debug mode for better debugging
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Exception traceback:\n{traceback.format_exc()}")
 
+    def _get_mute_state(self) -> bool:
+        """Return the cached mute state, asking the audio backend once it has expired."""
+        if self._cached_mute_state is None or time.monotonic_ns() > self._cache_valid_until_ns:
+            muted = self.audio_backend.is_muted(None)
+            self._store_mute_state(muted)
+            return muted
+        return self._cached_mute_state
+
+    def _store_mute_state(self, muted: bool) -> None:
+        """Record a mute state known to be current and restart its TTL."""
+        self._cached_mute_state = muted
+        self._cache_valid_until_ns = time.monotonic_ns() + self._mute_cache_ttl_ns
+
     def cleanup(self) -> None:
         """Clean up resources on shutdown."""
         try:
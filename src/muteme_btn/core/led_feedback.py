@@ -42,8 +42,13 @@ class LEDFeedbackController:
         self.device = device
         self._last_applied_color = None
 
-    def update_led_to_mute_status(self) -> None:
-        """Update LED color based on current audio mute status."""
+    def update_led_to_mute_status(self, is_muted: bool | None = None) -> None:
+        """Update LED color based on current audio mute status.
+
+        Args:
+            is_muted: Mute state already known to the caller; queried from the
+                audio backend when omitted
+        """
         try:
             # Check if device is connected
             if not self.device.is_connected():
@@ -52,7 +57,8 @@ class LEDFeedbackController:
                 return
 
             # Get current mute status
-            is_muted = self.audio_backend.is_muted(None)
+            if is_muted is None:
+                is_muted = self.audio_backend.is_muted(None)
 
             # Set appropriate LED color
             target_color = self.muted_color if is_muted else self.unmuted_color
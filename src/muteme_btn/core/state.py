@@ -1,13 +1,16 @@
 """Button state machine for toggle logic and button event handling."""
 
 import logging
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_MS = 1_000_000
+
 
 class ButtonState(Enum):
     """Button states for the state machine."""
@@ -21,7 +24,12 @@ class ButtonEvent:
     """Button event data structure."""
 
     type: str  # "press", "release", "timeout"
-    timestamp: datetime
+    timestamp_ns: int  # time.monotonic_ns() when the event occurred
+
+    @property
+    def timestamp(self) -> float:
+        """Event time in seconds on the monotonic clock."""
+        return self.timestamp_ns * 1e-9
 
 
 class ButtonStateMachine:
@@ -35,9 +43,9 @@ class ButtonStateMachine:
             debounce_time_ms: Minimum time between events to prevent bouncing
         """
         self.current_state: ButtonState = ButtonState.IDLE
-        self.last_press_time: datetime | None = None
+        self.last_press_ns: int | None = None
         self.press_count: int = 0
-        self.state_entry_time: datetime = datetime.now()
+        self.state_entry_ns: int = time.monotonic_ns()
 
         self.double_tap_timeout_ms = double_tap_timeout_ms
         self.debounce_time_ms = debounce_time_ms
@@ -48,6 +56,11 @@ class ButtonStateMachine:
             f"debounce_time={debounce_time_ms}ms"
         )
 
+    @property
+    def last_press_time(self) -> float | None:
+        """Time of the last counted press in seconds on the monotonic clock, if any."""
+        return None if self.last_press_ns is None else self.last_press_ns * 1e-9
+
     def process_event(self, event: ButtonEvent) -> list[str]:
         """Process a button event and return any actions to be taken.
 
@@ -62,22 +75,18 @@ class ButtonStateMachine:
             logger.debug(f"Debouncing event: {event.type}")
             return []
 
-        actions: list[str] = []
+        # Event types with no transition from the current state are ignored
+        transition = self._TRANSITIONS.get((self.current_state, event.type))
+        if transition is None:
+            return []
 
         try:
-            if self.current_state == ButtonState.IDLE:
-                actions = self._handle_idle_state(event)
-            elif self.current_state == ButtonState.PRESSED:
-                actions = self._handle_pressed_state(event)
-            else:
-                logger.warning(f"Unknown state: {self.current_state}")
-
+            return transition(self, event)
         except Exception as e:
             logger.error(f"Error processing event {event.type} in state {self.current_state}: {e}")
             # Reset to safe state on error
             self.reset()
-
-        return actions
+            return []
 
     def _should_debounce_event(self, event: ButtonEvent) -> bool:
         """Check if an event should be debounced (ignored due to rapid timing)."""
@@ -85,98 +94,87 @@ class ButtonStateMachine:
         if event.type != "press":
             return False
 
-        if self.last_press_time is None:
+        if self.last_press_ns is None:
             return False
 
-        time_since_last = (event.timestamp - self.last_press_time).total_seconds() * 1000
-        return time_since_last < self.debounce_time_ms
-
-    def _handle_idle_state(self, event: ButtonEvent) -> list[str]:
-        """Handle events when in IDLE state."""
-        actions: list[str] = []
-
-        if event.type == "press":
-            now = event.timestamp
-            # Check if this press is within the double-tap timeout window
-            if (
-                self.last_press_time
-                and (now - self.last_press_time).total_seconds() * 1000
-                <= self.double_tap_timeout_ms
-            ):
-                self.press_count += 1
-                logger.debug(f"Double-tap window hit (press #{self.press_count})")
-            else:
-                self.press_count = 1
-            self.last_press_time = now
-            self.current_state = ButtonState.PRESSED
-            self.state_entry_time = now
-            logger.debug(f"Transitioned to PRESSED state (press #{self.press_count})")
-
-        elif event.type == "timeout":
-            # Check if we should reset due to timeout
-            if self._should_timeout(event.timestamp):
-                self._reset_press_count()
-                logger.debug("Timeout reset press count")
-
-        return actions
-
-    def _handle_pressed_state(self, event: ButtonEvent) -> list[str]:
-        """Handle events when in PRESSED state."""
-        actions: list[str] = []
-
-        if event.type == "release":
-            # Trigger toggle action on release
-            actions.append("toggle")
-
-            # Check for double-tap
-            if self.press_count >= 2:
-                actions.append("double_tap")
-                self.press_count = 0
-                self.last_press_time = None
-
-            # Return to idle state
-            self.current_state = ButtonState.IDLE
-            self.state_entry_time = event.timestamp
-            logger.debug("Toggle action triggered, returned to IDLE state")
-
-        elif event.type == "press":
-            # Another press while already pressed (could be double-tap)
-            if self.last_press_time is None:
-                time_since_last = float("inf")
-            else:
-                time_since_last = (event.timestamp - self.last_press_time).total_seconds() * 1000
-
-            if time_since_last < self.double_tap_timeout_ms:
-                self.press_count += 1
-                self.last_press_time = event.timestamp
-                logger.debug(f"Double-tap detected (press #{self.press_count})")
-            else:
-                # Treat as new press sequence
-                self.press_count = 1
-                self.last_press_time = event.timestamp
-                logger.debug(f"New press sequence (press #{self.press_count})")
-
+        return event.timestamp_ns - self.last_press_ns < self.debounce_time_ms * _NS_PER_MS
+
+    def _press_from_idle(self, event: ButtonEvent) -> list[str]:
+        """Handle a press in IDLE state: enter PRESSED, counting presses in the tap window."""
+        now_ns = event.timestamp_ns
+        # Check if this press is within the double-tap timeout window
+        if (
+            self.last_press_ns is not None
+            and now_ns - self.last_press_ns <= self.double_tap_timeout_ms * _NS_PER_MS
+        ):
+            self.press_count += 1
+            logger.debug(f"Double-tap window hit (press #{self.press_count})")
+        else:
+            self.press_count = 1
+        self.last_press_ns = now_ns
+        self.current_state = ButtonState.PRESSED
+        self.state_entry_ns = now_ns
+        logger.debug(f"Transitioned to PRESSED state (press #{self.press_count})")
+        return []
+
+    def _timeout_in_idle(self, event: ButtonEvent) -> list[str]:
+        """Handle a timeout in IDLE state: forget presses older than the tap window."""
+        if self._should_timeout(event.timestamp_ns):
+            self._reset_press_count()
+            logger.debug("Timeout reset press count")
+        return []
+
+    def _release_from_pressed(self, event: ButtonEvent) -> list[str]:
+        """Handle a release in PRESSED state: toggle, plus double_tap on a repeat press."""
+        # Trigger toggle action on release
+        actions = ["toggle"]
+
+        # Check for double-tap
+        if self.press_count >= 2:
+            actions.append("double_tap")
+            self.press_count = 0
+            self.last_press_ns = None
+
+        # Return to idle state
+        self.current_state = ButtonState.IDLE
+        self.state_entry_ns = event.timestamp_ns
+        logger.debug("Toggle action triggered, returned to IDLE state")
         return actions
 
-    def _should_timeout(self, current_time: datetime) -> bool:
+    def _press_while_pressed(self, event: ButtonEvent) -> list[str]:
+        """Handle another press in PRESSED state (missed release or double-tap)."""
+        if (
+            self.last_press_ns is not None
+            and event.timestamp_ns - self.last_press_ns < self.double_tap_timeout_ms * _NS_PER_MS
+        ):
+            self.press_count += 1
+            self.last_press_ns = event.timestamp_ns
+            logger.debug(f"Double-tap detected (press #{self.press_count})")
+        else:
+            # Treat as new press sequence
+            self.press_count = 1
+            self.last_press_ns = event.timestamp_ns
+            logger.debug(f"New press sequence (press #{self.press_count})")
+        return []
+
+    def _should_timeout(self, current_ns: int) -> bool:
         """Check if the state should timeout due to inactivity."""
-        if self.last_press_time is None:
+        if self.last_press_ns is None:
             return False
 
-        time_since_last = (current_time - self.last_press_time).total_seconds() * 1000
-        return time_since_last > self.double_tap_timeout_ms
+        return current_ns - self.last_press_ns > self.double_tap_timeout_ms * _NS_PER_MS
 
     def _reset_press_count(self) -> None:
         """Reset the press count and related state."""
         self.press_count = 0
-        self.last_press_time = None
+        self.last_press_ns = None
 
     def reset(self) -> None:
         """Reset the state machine to initial state."""
         self.current_state = ButtonState.IDLE
-        self.last_press_time = None
+        self.last_press_ns = None
         self.press_count = 0
-        self.state_entry_time = datetime.now()
+        self.state_entry_ns = time.monotonic_ns()
         logger.debug("State machine reset to IDLE state")
 
     def get_state_info(self) -> dict[str, Any]:
@@ -185,7 +183,7 @@ class ButtonStateMachine:
         Returns:
             Dictionary containing current state information
         """
-        duration_in_state = (datetime.now() - self.state_entry_time).total_seconds()
+        duration_in_state = (time.monotonic_ns() - self.state_entry_ns) * 1e-9
 
         return {
             "state": self.current_state,
@@ -195,3 +193,13 @@ class ButtonStateMachine:
             "double_tap_timeout_ms": self.double_tap_timeout_ms,
             "debounce_time_ms": self.debounce_time_ms,
         }
+
+    # (state, event type) -> transition, looked up once per event in process_event
+    _TRANSITIONS: dict[
+        tuple[ButtonState, str], Callable[["ButtonStateMachine", ButtonEvent], list[str]]
+    ] = {
+        (ButtonState.IDLE, "press"): _press_from_idle,
+        (ButtonState.IDLE, "timeout"): _timeout_in_idle,
+        (ButtonState.PRESSED, "release"): _release_from_pressed,
+        (ButtonState.PRESSED, "press"): _press_while_pressed,
+    }
@@ -1,12 +1,13 @@
 """HID communication layer for MuteMe button control."""
 
-from .device import DeviceError, DeviceInfo, LEDColor, MuteMeDevice
+from .device import DeviceError, DeviceEvent, DeviceInfo, LEDColor, MuteMeDevice
 from .events import ButtonEvent, EventHandler
 
 __all__ = [
     "MuteMeDevice",
     "DeviceInfo",
     "DeviceError",
+    "DeviceEvent",
     "LEDColor",
     "ButtonEvent",
     "EventHandler",
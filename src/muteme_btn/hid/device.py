@@ -1,23 +1,128 @@
 """HID device discovery and communication for MuteMe buttons."""
 
-import grp
+import functools
 import os
-import pwd
 import stat
 import time
 from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
-from typing import Any
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import hid  # type: ignore[import-untyped]
-import structlog
+from ..utils.logging import LazyLogger, is_debug_enabled
+from .events import _PRESS_BYTES
 
-logger = structlog.get_logger(__name__)
+if TYPE_CHECKING:
+    import hid  # type: ignore[import-untyped]
 
+logger = LazyLogger(__name__)
 
-class LEDColor(Enum):
-    """LED color options for MuteMe devices."""
+
+@functools.cache
+def _hid() -> Any:
+    """Import hidapi on first use; it loads a C extension and libhidapi."""
+    import hid  # type: ignore[import-untyped]
+
+    return hid
+
+
+# hid.enumerate() walks the whole USB/hidraw bus. Discovery is usually followed right away
+# by a connect that needs the same data, so keep the last result around briefly.
+ENUMERATION_CACHE_TTL_SECONDS = 3.0
+_enum_cache: tuple[tuple[int, ...], float, list[dict[str, Any]]] | None = None
+
+
+def _cached_enumerate(
+    vendor_ids: tuple[int, ...], ttl: float = ENUMERATION_CACHE_TTL_SECONDS
+) -> list[dict[str, Any]]:
+    """Enumerate HID devices for the given vendors, reusing a scan younger than ttl.
+
+    The vendor filter is passed to hidapi so unrelated devices are skipped in C
+    rather than materialized as Python dicts.
+
+    Args:
+        vendor_ids: USB vendor IDs to enumerate
+        ttl: Maximum age of cached results in seconds
+
+    Returns:
+        List of hidapi device descriptor dicts
+    """
+    global _enum_cache
+    now = time.monotonic()
+    if _enum_cache is not None and _enum_cache[0] == vendor_ids and now - _enum_cache[1] < ttl:
+        return _enum_cache[2]
+
+    hid_devices: list[dict[str, Any]] = []
+    for vendor_id in vendor_ids:
+        hid_devices.extend(_hid().enumerate(vendor_id, 0))
+    _enum_cache = (vendor_ids, now, hid_devices)
+    return hid_devices
+
+
+def _invalidate_enumeration_cache() -> None:
+    """Drop cached enumeration results so the next discovery rescans the bus."""
+    global _enum_cache
+    _enum_cache = None
+
+
+# Permission bits meaning "someone can read/write", for the permission diagnostic
+_READ_MASK = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+_WRITE_MASK = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+@functools.lru_cache(maxsize=64)
+def _uid_name(uid: int) -> str:
+    """Resolve a UID to a user name, falling back to the numeric ID."""
+    import pwd
+
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@functools.lru_cache(maxsize=64)
+def _gid_name(gid: int) -> str:
+    """Resolve a GID to a group name, falling back to the numeric ID."""
+    import grp
+
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+@functools.cache
+def _build_led_report(report_format: str, raw_value: int) -> bytes:
+    """Build report bytes for an LED value based on report_format.
+
+    Reports are immutable and the set of (format, value) pairs is tiny, so results are
+    memoized to avoid rebuilding the same bytes on every LED update.
+
+    Args:
+        report_format: Report format name (see MuteMeDevice.set_led_color)
+        raw_value: Color value (including brightness offset) to include in report
+
+    Returns:
+        Report bytes according to report_format
+    """
+    if report_format == "no_report_id":
+        return bytes([raw_value])
+    elif report_format == "report_id_0":
+        return bytes([0x00, raw_value])
+    elif report_format == "report_id_2":
+        return bytes([0x02, raw_value])
+    elif report_format == "padded":
+        return bytes([0x01, raw_value, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
+    else:  # standard
+        return bytes([0x01, raw_value])
+
+
+class LEDColor(IntEnum):
+    """LED color options for MuteMe devices.
+
+    Members are ints, so they can be OR-ed with brightness offsets and used as
+    report bytes directly.
+    """
 
     NOCOLOR = 0x00
     RED = 0x01
@@ -49,7 +154,7 @@ class LEDColor(Enum):
             ) from None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Information about a discovered MuteMe device."""
 
@@ -60,22 +165,52 @@ class DeviceInfo:
     product: str | None = None
 
 
+class DeviceEvent(NamedTuple):
+    """Button event returned by MuteMeDevice.read_events()."""
+
+    type: str  # "press" or "release"
+    timestamp_ns: int  # time.monotonic_ns() when the report was read
+
+
 class DeviceError(Exception):
     """Raised when device operations fail."""
 
     pass
 
 
+def _close_quietly(device: Any) -> None:
+    """Close a hidapi handle on an error path without masking the original error."""
+    try:
+        device.close()
+    except Exception as e:
+        logger.debug("Error closing device handle after failed connect", error=str(e))
+
+
+def _device_info_from_hid(device: dict[str, Any]) -> DeviceInfo:
+    """Build DeviceInfo from a hid.enumerate() descriptor dict."""
+    path = device["path"]
+    return DeviceInfo(
+        vendor_id=device["vendor_id"],
+        product_id=device["product_id"],
+        path=path.decode("utf-8") if isinstance(path, bytes) else path,
+        manufacturer=device.get("manufacturer_string"),
+        product=device.get("product_string"),
+    )
+
+
 class MuteMeDevice:
     """HID device communication for MuteMe buttons."""
 
     # Supported MuteMe device variants
     MUTEME_VID = 0x20A0
-    MUTEME_PIDS = [0x42DA, 0x42DB]  # Main MuteMe devices
+    MUTEME_PIDS = frozenset({0x42DA, 0x42DB})  # Main MuteMe devices
     MINI_VID = 0x3603
-    MINI_PIDS = [0x0001, 0x0002, 0x0003, 0x0004]  # MuteMe Mini variants
+    MINI_PIDS = frozenset({0x0001, 0x0002, 0x0003, 0x0004})  # MuteMe Mini variants
 
-    def __init__(self, device: hid.device | None = None, device_info: DeviceInfo | None = None):
+    # Supported product IDs keyed by vendor ID (single lookup per enumerated device)
+    _SUPPORTED: dict[int, frozenset[int]] = {MUTEME_VID: MUTEME_PIDS, MINI_VID: MINI_PIDS}
+
+    def __init__(self, device: "hid.device | None" = None, device_info: DeviceInfo | None = None):
         """Initialize MuteMe device.
 
         Args:
@@ -84,6 +219,7 @@ class MuteMeDevice:
         """
         self._device = device
         self._device_info = device_info
+        self._nonblocking = False
 
     @classmethod
     def discover_devices(cls) -> list[DeviceInfo]:
@@ -95,43 +231,65 @@ class MuteMeDevice:
         devices = []
 
         try:
-            # Enumerate all HID devices
-            hid_devices = hid.enumerate()
+            # Enumerate MuteMe vendors only (served from cache if scanned very recently)
+            hid_devices = _cached_enumerate(tuple(cls._SUPPORTED))
             logger.debug("Enumerated HID devices", count=len(hid_devices))
 
             for device in hid_devices:
                 vid = device["vendor_id"]
                 pid = device["product_id"]
 
-                # Check if this is a supported MuteMe device
+                # Vendor is already filtered by hidapi; still check the product ID
                 if cls._is_muteme_device(vid, pid):
-                    path = (
-                        device["path"].decode("utf-8")
-                        if isinstance(device["path"], bytes)
-                        else device["path"]
-                    )
-                    device_info = DeviceInfo(
-                        vendor_id=vid,
-                        product_id=pid,
-                        path=path,
-                        manufacturer=device.get("manufacturer_string"),
-                        product=device.get("product_string"),
-                    )
-                    devices.append(device_info)
-                    logger.info(
-                        "Found MuteMe device",
-                        vendor_id=f"0x{vid:04x}",
-                        product_id=f"0x{pid:04x}",
-                        path=path,
-                        product=device_info.product,
-                    )
+                    devices.append(_device_info_from_hid(device))
 
         except Exception as e:
             logger.error("Failed to enumerate HID devices", error=str(e))
             raise DeviceError(f"Device enumeration failed: {e}") from e
 
+        # Log once per scan rather than once per device; reconnect loops rescan often
+        if devices:
+            logger.info(
+                "Found MuteMe devices",
+                count=len(devices),
+                devices=[
+                    (f"0x{d.vendor_id:04x}", f"0x{d.product_id:04x}", d.path) for d in devices
+                ],
+            )
+
         return devices
 
+    @classmethod
+    def _lookup_device_info(
+        cls,
+        path: str | None = None,
+        vendor_id: int | None = None,
+        product_id: int | None = None,
+    ) -> DeviceInfo | None:
+        """Find an enumerated device matching every given criterion.
+
+        Unlike discover_devices(), this builds a single DeviceInfo and logs nothing,
+        so describing a freshly opened handle does not repeat discovery work.
+
+        Args:
+            path: Device path from hid.enumerate()
+            vendor_id: USB vendor ID
+            product_id: USB product ID
+
+        Returns:
+            DeviceInfo for the first match, or None if no device matches
+        """
+        path_bytes = path.encode("utf-8") if path is not None else None
+        for device in _cached_enumerate(tuple(cls._SUPPORTED)):
+            if path is not None and device["path"] not in (path, path_bytes):
+                continue
+            if vendor_id is not None and device["vendor_id"] != vendor_id:
+                continue
+            if product_id is not None and device["product_id"] != product_id:
+                continue
+            return _device_info_from_hid(device)
+        return None
+
     @classmethod
     def _is_muteme_device(cls, vendor_id: int, product_id: int) -> bool:
         """Check if device is a supported MuteMe variant.
@@ -143,9 +301,7 @@ class MuteMeDevice:
         Returns:
             True if device is supported MuteMe variant
         """
-        return (vendor_id == cls.MUTEME_VID and product_id in cls.MUTEME_PIDS) or (
-            vendor_id == cls.MINI_VID and product_id in cls.MINI_PIDS
-        )
+        return product_id in cls._SUPPORTED.get(vendor_id, frozenset())
 
     @classmethod
     def connect(cls, device_path: str) -> "MuteMeDevice":
@@ -160,11 +316,12 @@ class MuteMeDevice:
         Raises:
             DeviceError: If connection fails
         """
+        opened = None
         try:
             logger.info("Connecting to MuteMe device", path=device_path)
 
             # Create hidapi device instance
-            device = hid.device()
+            device = _hid().device()
 
             # Try to open using the path from enumerate()
             # The path should be bytes
@@ -176,15 +333,12 @@ class MuteMeDevice:
             )
 
             device.open_path(path_bytes)
+            opened = device
 
             logger.debug("Device opened successfully, verifying connection")
 
-            # Get device info for logging
-            device_info = None
-            for info in cls.discover_devices():
-                if info.path == device_path:
-                    device_info = info
-                    break
+            # Describe the opened device from the enumeration cache (no rescan)
+            device_info = cls._lookup_device_info(path=device_path)
 
             logger.info(
                 "Successfully connected to MuteMe device",
@@ -193,9 +347,17 @@ class MuteMeDevice:
                 product_id=f"0x{device_info.product_id:04x}" if device_info else "unknown",
             )
 
-            return cls(device, device_info)
+            muteme = cls(device, device_info)
+            # Event polling runs on the asyncio loop; never let hidapi block it
+            muteme.set_nonblocking(True)
+            return muteme
 
         except Exception as e:
+            # A post-open step failed; don't leak the open handle
+            if opened is not None:
+                _close_quietly(opened)
+            # Cached enumeration may describe a device that has since gone away
+            _invalidate_enumeration_cache()
             message = "Failed to connect to MuteMe device"
             log_context = {
                 "path": device_path,
@@ -236,6 +398,7 @@ class MuteMeDevice:
         Raises:
             DeviceError: If connection fails
         """
+        opened = None
         try:
             logger.info(
                 "Connecting to MuteMe device by VID/PID",
@@ -244,19 +407,16 @@ class MuteMeDevice:
             )
 
             # Create hidapi device instance
-            device = hid.device()
+            device = _hid().device()
 
             # Try to open using VID/PID
             device.open(vendor_id, product_id)
+            opened = device
 
             logger.debug("Device opened successfully by VID/PID")
 
-            # Get device info for logging
-            device_info = None
-            for info in cls.discover_devices():
-                if info.vendor_id == vendor_id and info.product_id == product_id:
-                    device_info = info
-                    break
+            # Describe the opened device from the enumeration cache (no rescan)
+            device_info = cls._lookup_device_info(vendor_id=vendor_id, product_id=product_id)
 
             logger.info(
                 "Successfully connected to MuteMe device by VID/PID",
@@ -265,9 +425,17 @@ class MuteMeDevice:
                 path=device_info.path if device_info else "unknown",
             )
 
-            return cls(device, device_info)
+            muteme = cls(device, device_info)
+            # Event polling runs on the asyncio loop; never let hidapi block it
+            muteme.set_nonblocking(True)
+            return muteme
 
         except Exception as e:
+            # A post-open step failed; don't leak the open handle
+            if opened is not None:
+                _close_quietly(opened)
+            # Cached enumeration may describe a device that has since gone away
+            _invalidate_enumeration_cache()
             message = "Failed to connect to MuteMe device by VID/PID"
             log_context = {
                 "vendor_id": f"0x{vendor_id:04x}",
@@ -347,6 +515,24 @@ class MuteMeDevice:
         """
         return self._device is not None
 
+    def set_nonblocking(self, enabled: bool) -> None:
+        """Switch the hidapi handle between blocking and non-blocking reads.
+
+        In non-blocking mode a read without a timeout returns immediately with
+        whatever is queued instead of waiting for the next report.
+
+        Args:
+            enabled: True for non-blocking reads
+
+        Raises:
+            DeviceError: If device is not connected
+        """
+        if self._device is None:
+            raise DeviceError("Device not connected")
+
+        self._device.set_nonblocking(1 if enabled else 0)
+        self._nonblocking = enabled
+
     def get_device_info(self) -> DeviceInfo | None:
         """Get device information.
 
@@ -376,15 +562,77 @@ class MuteMeDevice:
 
         try:
             data = self._device.read(size, timeout_ms)  # type: ignore[union-attr]
-            if len(data) > 0:
+            if len(data) > 0 and is_debug_enabled():
                 logger.debug("Read data from device", size=len(data), timeout_ms=timeout_ms)
             return bytes(data)
         except Exception as e:
-            # Treat read failures as a disconnected/stale handle (common after sleep/wake).
-            # Closing the handle prevents repeated read failures from spamming logs.
-            self.disconnect()
-            logger.warning("Failed to read from device, disconnected handle", error=str(e))
-            raise DeviceError(f"Device read failed: {e}") from e
+            raise self._read_failure(e) from e
+
+    def _read_failure(self, error: Exception) -> DeviceError:
+        """Drop the handle after a failed read and build the error to raise.
+
+        Args:
+            error: Exception raised by hidapi
+
+        Returns:
+            DeviceError describing the failure
+        """
+        # Treat read failures as a disconnected/stale handle (common after sleep/wake).
+        # Closing the handle prevents repeated read failures from spamming logs.
+        self.disconnect()
+        logger.warning("Failed to read from device, disconnected handle", error=str(error))
+        return DeviceError(f"Device read failed: {error}")
+
+    def read_batch(
+        self, report_size: int = 8, max_reports: int = 16, timeout_ms: int = 10
+    ) -> list[bytes]:
+        """Read all pending reports from device in one call.
+
+        Waits up to timeout_ms for the first report, then drains whatever else is
+        already queued without blocking.
+
+        Args:
+            report_size: Maximum size of each report in bytes
+            max_reports: Maximum number of reports to return
+            timeout_ms: Timeout in milliseconds for the first report
+
+        Returns:
+            List of raw reports, oldest first (empty if nothing arrived)
+
+        Raises:
+            DeviceError: If read fails
+        """
+        if not self.is_connected():
+            raise DeviceError("Device not connected")
+
+        if self._device is None:
+            raise DeviceError("Device not connected")
+
+        reports: list[bytes] = []
+        try:
+            data = self._device.read(report_size, timeout_ms)  # type: ignore[union-attr]
+            if data:
+                reports.append(bytes(data))
+                # hidapi treats a zero timeout as "block forever" unless the handle is
+                # non-blocking, so a blocking handle switches modes only for the drain.
+                toggle = not self._nonblocking
+                if toggle:
+                    self._device.set_nonblocking(1)  # type: ignore[union-attr]
+                try:
+                    while len(reports) < max_reports:
+                        data = self._device.read(report_size)  # type: ignore[union-attr]
+                        if not data:
+                            break
+                        reports.append(bytes(data))
+                finally:
+                    if toggle:
+                        self._device.set_nonblocking(0)  # type: ignore[union-attr]
+        except Exception as e:
+            raise self._read_failure(e) from e
+
+        if reports and is_debug_enabled():
+            logger.debug("Read reports from device", count=len(reports), timeout_ms=timeout_ms)
+        return reports
 
     def write(self, data: bytes) -> None:
         """Write data to device.
@@ -403,18 +651,17 @@ class MuteMeDevice:
 
         try:
             self._device.write(data)  # type: ignore[union-attr]
-            logger.debug("Wrote data to device", size=len(data))
+            if is_debug_enabled():
+                logger.debug("Wrote data to device", size=len(data))
         except Exception as e:
             logger.error("Failed to write to device", error=str(e))
             raise DeviceError(f"Device write failed: {e}") from e
 
-    async def read_events(self) -> list[Any]:
+    async def read_events(self) -> list[DeviceEvent]:
         """Read button events from the device (non-blocking).
 
         Returns:
-            List of button events. Each event has:
-            - type: "press" or "release"
-            - timestamp: datetime object
+            List of DeviceEvent records (type "press" or "release", monotonic timestamp_ns)
 
         Note:
             This method reads available data without blocking. If no data is available,
@@ -429,21 +676,18 @@ class MuteMeDevice:
         events = []
         try:
             # MuteMe sends 4-byte HID interrupt reports
-            # Byte 3 (index 3) contains the button state: 0x00 = released, 0x01 = pressed
-            data = self.read(size=4, timeout_ms=10)
+            # Byte 3 (index 3) contains the button state, decoded with the same rule as
+            # EventHandler: 0x01-0x04 are press variants, anything else is a release
+            # Drain everything queued since the last poll in one call. A non-blocking
+            # handle needs no wait; the caller's poll interval paces the loop.
+            timeout_ms = 0 if self._nonblocking else 10
+            for data in self.read_batch(report_size=4, timeout_ms=timeout_ms):
+                if len(data) < 4:
+                    continue
 
-            if len(data) >= 4:
                 button_byte = data[3]
-                event_type = "press" if button_byte == 0x01 else "release"
-                timestamp = datetime.now()
-
-                # Create a simple event object
-                @dataclass
-                class DeviceEvent:
-                    type: str
-                    timestamp: datetime
-
-                events.append(DeviceEvent(type=event_type, timestamp=timestamp))
+                event_type = "press" if button_byte in _PRESS_BYTES else "release"
+                events.append(DeviceEvent(type=event_type, timestamp_ns=time.monotonic_ns()))
                 logger.info(
                     f"Button event detected: {event_type} "
                     f"(raw data: {data.hex()}, button byte: 0x{button_byte:02x})"
@@ -491,24 +735,8 @@ class MuteMeDevice:
             raise DeviceError("Device not connected")
 
         def _build_report(raw_value: int) -> bytes:
-            """Build report bytes based on report_format.
-
-            Args:
-                raw_value: Color value to include in report
-
-            Returns:
-                Report bytes according to report_format
-            """
-            if report_format == "no_report_id":
-                return bytes([raw_value])
-            elif report_format == "report_id_0":
-                return bytes([0x00, raw_value])
-            elif report_format == "report_id_2":
-                return bytes([0x02, raw_value])
-            elif report_format == "padded":
-                return bytes([0x01, raw_value, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-            else:  # standard
-                return bytes([0x01, raw_value])
+            """Return the (memoized) report bytes for raw_value in report_format."""
+            return _build_led_report(report_format, raw_value)
 
         def _send_report(report: bytes) -> None:
             """Send report using appropriate transport method.
@@ -523,13 +751,13 @@ class MuteMeDevice:
 
         try:
             # Apply brightness/effect offset
-            color_value = color.value
+            color_value = int(color)
             if brightness == "dim":
-                color_value = color.value | 0x10
+                color_value = color | 0x10
             elif brightness == "fast_pulse":
-                color_value = color.value | 0x20
+                color_value = color | 0x20
             elif brightness == "slow_pulse":
-                color_value = color.value | 0x30
+                color_value = color | 0x30
             elif brightness == "flashing":
                 # Software-side flashing animation (device firmware may not support 0x40 offset)
                 # This creates a rapid on/off flashing effect
@@ -538,16 +766,16 @@ class MuteMeDevice:
 
                 for _ in range(flash_cycles):
                     # Turn LED on with full brightness
-                    report_on = _build_report(color.value)
+                    report_on = _build_report(color)
                     _send_report(report_on)
                     time.sleep(flash_duration)
                     # Turn LED off
-                    report_off = _build_report(LEDColor.NOCOLOR.value)
+                    report_off = _build_report(LEDColor.NOCOLOR)
                     _send_report(report_off)
                     time.sleep(flash_duration * 0.3)  # Shorter off period for faster flash
 
                 # Leave LED on at end of flashing
-                color_value = color.value
+                color_value = int(color)
                 final_report = _build_report(color_value)
                 _send_report(final_report)
                 logger.debug(
@@ -569,15 +797,16 @@ class MuteMeDevice:
             # Send report using appropriate transport
             _send_report(report)
 
-            # Log the operation
-            logger.debug(
-                "Set LED color",
-                color=color.name,
-                value=color_value,
-                format=report_format,
-                brightness=brightness,
-                report=report.hex(),
-            )
+            # Log the operation (skip building the fields when DEBUG is off)
+            if is_debug_enabled():
+                logger.debug(
+                    "Set LED color",
+                    color=color.name,
+                    value=color_value,
+                    format=report_format,
+                    brightness=brightness,
+                    report=report.hex(),
+                )
         except Exception as e:
             logger.error("Failed to set LED color", color=color.name, error=str(e))
             raise DeviceError(f"LED control failed: {e}") from e
@@ -606,9 +835,20 @@ class MuteMeDevice:
         Returns:
             Path to hidraw device (e.g., '/dev/hidraw0') or None if not found
         """
+        # hidapi's hidraw backend reports /dev/hidraw* paths itself, so the cached
+        # discovery scan usually answers this without touching sysfs
+        try:
+            for device in _cached_enumerate(tuple(cls._SUPPORTED)):
+                if device["vendor_id"] == vendor_id and device["product_id"] == product_id:
+                    path = _device_info_from_hid(device).path
+                    if path.startswith("/dev/hidraw"):
+                        return path
+        except Exception as e:
+            logger.debug("HID enumeration unavailable, scanning sysfs", error=str(e))
+
         import glob
 
-        # Check all hidraw devices by reading sysfs uevent
+        # libusb backend (or enumeration failed): check hidraw devices via sysfs uevent
         for hidraw_path in sorted(glob.glob("/dev/hidraw*")):
             try:
                 # Extract hidraw number (e.g., "0" from "/dev/hidraw0")
@@ -681,34 +921,46 @@ class MuteMeDevice:
         Returns:
             Detailed error message with permission information
         """
+        return cls._fast_permissions_check(device_path) or cls._permissions_diagnostic(device_path)
+
+    @classmethod
+    def _fast_permissions_check(cls, device_path: str) -> str | None:
+        """Answer the missing-device case without stat or user/group lookups.
+
+        Args:
+            device_path: Path to the HID device
+
+        Returns:
+            Short message if the device is missing, None if a full diagnostic is needed
+        """
+        if not os.path.exists(device_path):
+            # Typically a transient unplug race
+            return f"Device {device_path} not found"
+        return None
+
+    @classmethod
+    def _permissions_diagnostic(cls, device_path: str) -> str:
+        """Build the full ownership/mode report for an inaccessible device.
+
+        Args:
+            device_path: Path to the HID device
+
+        Returns:
+            Detailed error message with permission information and suggested fixes
+        """
         try:
             device_stat = os.stat(device_path)
             mode = device_stat.st_mode
-            uid = device_stat.st_uid
-            gid = device_stat.st_gid
-
-            # Get user and group names
-            try:
-                user_name = pwd.getpwuid(uid).pw_name
-            except KeyError:
-                user_name = str(uid)
 
-            try:
-                group_name = grp.getgrgid(gid).gr_name
-            except KeyError:
-                group_name = str(gid)
-
-            # Check current user
+            # Name lookups can hit NSS (LDAP/SSSD), so they are cached per ID
+            user_name = _uid_name(device_stat.st_uid)
+            group_name = _gid_name(device_stat.st_gid)
             current_uid = os.getuid()
-            current_user = pwd.getpwuid(current_uid).pw_name
+            current_user = _uid_name(current_uid)
 
             # Check permissions
-            readable = (
-                bool(mode & stat.S_IRUSR) or bool(mode & stat.S_IRGRP) or bool(mode & stat.S_IROTH)
-            )
-            writable = (
-                bool(mode & stat.S_IWUSR) or bool(mode & stat.S_IWGRP) or bool(mode & stat.S_IWOTH)
-            )
+            readable = bool(mode & _READ_MASK)
+            writable = bool(mode & _WRITE_MASK)
 
             error_msg = (
                 f"Cannot access device {device_path}.\n"
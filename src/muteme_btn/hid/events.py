@@ -5,9 +5,9 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 
-import structlog
+from ..utils.logging import LazyLogger, is_debug_enabled
 
-logger = structlog.get_logger(__name__)
+logger = LazyLogger(__name__)
 
 
 class ButtonState(Enum):
@@ -17,14 +17,27 @@ class ButtonState(Enum):
     PRESSED = 1
 
 
+# Report byte -> index into _STATES. 0x01-0x04 are the press variants the
+# device reports (press, short, long, double); everything else is a release.
+_PRESS_BYTES = frozenset({0x01, 0x02, 0x03, 0x04})
+_STATE_LUT = bytes(int(b in _PRESS_BYTES) for b in range(256))
+# Spelled out rather than tuple(ButtonState) so member order can't flip the decode
+_STATES = (ButtonState.RELEASED, ButtonState.PRESSED)
+
+
 @dataclass
 class ButtonEvent:
     """Represents a button press/release event."""
 
     state: ButtonState
-    timestamp: float
+    timestamp_ns: int
     device_path: str
 
+    @property
+    def timestamp(self) -> float:
+        """Event time in seconds on the monotonic clock."""
+        return self.timestamp_ns * 1e-9
+
     @property
     def is_press(self) -> bool:
         """Check if this is a press event."""
@@ -62,19 +75,21 @@ class EventHandler:
         Args:
             data: Raw bytes from HID device
         """
-        # MuteMe sends simple 1-byte reports where 0x00 = released, 0x01 = pressed
-        if len(data) >= 1:
-            button_byte = data[0]
-            state = ButtonState.PRESSED if button_byte == 0x01 else ButtonState.RELEASED
-
-            event = ButtonEvent(state=state, timestamp=time.time(), device_path=self.device_path)
-
-            logger.debug(
-                "Button event detected",
-                state=state.name,
-                timestamp=event.timestamp,
-                device_path=self.device_path,
+        # MuteMe sends 1-byte reports: 0x00 = released, 0x01-0x04 = press variants
+        if data:
+            state = _STATES[_STATE_LUT[data[0]]]
+
+            event = ButtonEvent(
+                state=state, timestamp_ns=time.monotonic_ns(), device_path=self.device_path
             )
 
+            if is_debug_enabled():
+                logger.debug(
+                    "Button event detected",
+                    state=state.name,
+                    timestamp_ns=event.timestamp_ns,
+                    device_path=self.device_path,
+                )
+
             if self._event_callback:
                 self._event_callback(event)
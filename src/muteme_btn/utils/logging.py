@@ -1,12 +1,76 @@
 """Structured logging configuration for MuteMe Button Control."""
 
+import functools
 import logging
 import logging.handlers
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import structlog
+if TYPE_CHECKING:
+    import structlog
+
+# Cached "is DEBUG enabled" flag so per-transfer HID logging can skip building structlog
+# kwargs entirely in the common INFO case. Kept current by setup_logging()/refresh_log_level().
+_DEBUG_ENABLED = False
+
+
+def refresh_log_level() -> bool:
+    """Recompute the cached DEBUG flag from the current stdlib logging level.
+
+    Call this after changing log levels outside of setup_logging().
+
+    Returns:
+        True if DEBUG logging is enabled for the muteme_btn package
+    """
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = logging.getLogger("muteme_btn").isEnabledFor(logging.DEBUG)
+    return _DEBUG_ENABLED
+
+
+def is_debug_enabled() -> bool:
+    """Check the cached DEBUG flag without consulting the logging hierarchy.
+
+    Returns:
+        True if DEBUG logging was enabled at the last setup/refresh
+    """
+    return _DEBUG_ENABLED
+
+
+@functools.cache
+def _processor_chain(format_type: str, colors: bool) -> tuple[Any, ...]:
+    """Build the structlog processor chain for a format, once per combination.
+
+    Args:
+        format_type: Output format - 'text' or 'json'
+        colors: Whether the text renderer should emit ANSI colors
+
+    Returns:
+        Tuple of structlog processors
+    """
+    import structlog
+
+    base = (
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+    )
+
+    if format_type == "json":
+        return base + (
+            structlog.processors.dict_tracebacks,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer(),
+        )
+
+    # text format
+    return base + (
+        structlog.processors.UnicodeDecoder(),
+        structlog.dev.ConsoleRenderer(colors=colors),
+    )
 
 
 def setup_logging(
@@ -25,6 +89,8 @@ def setup_logging(
         max_file_size: Maximum log file size in bytes (for file logging)
         backup_count: Number of backup files to keep (for file logging)
     """
+    import structlog
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
@@ -50,42 +116,18 @@ def setup_logging(
         root_logger = logging.getLogger()
         root_logger.addHandler(file_handler)
 
-    # Configure structlog processors based on format type
-    processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-    ]
-
-    if format_type == "json":
-        processors.extend(
-            [
-                structlog.processors.dict_tracebacks,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer(),
-            ]
-        )
-    else:  # text format
-        processors.extend(
-            [
-                structlog.processors.UnicodeDecoder(),
-                structlog.dev.ConsoleRenderer(colors=sys.stdout.isatty()),
-            ]
-        )
-
     # Configure structlog
     structlog.configure(
-        processors=processors,
+        processors=list(_processor_chain(format_type, sys.stdout.isatty())),
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
+    refresh_log_level()
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+
+def get_logger(name: str) -> "structlog.stdlib.BoundLogger":
     """Get a structured logger instance.
 
     Args:
@@ -94,13 +136,40 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     Returns:
         Configured structlog logger instance
     """
+    import structlog
+
     return structlog.get_logger(name)
 
 
+class LazyLogger:
+    """Module-level logger that defers importing structlog until first use.
+
+    structlog is comparatively slow to import, so modules on the CLI startup path
+    use this instead of calling structlog.get_logger() at import time.
+    """
+
+    __slots__ = ("_name", "_logger")
+
+    def __init__(self, name: str):
+        """Initialize lazy logger.
+
+        Args:
+            name: Logger name (typically __name__)
+        """
+        self._name = name
+        self._logger: Any = None
+
+    def __getattr__(self, attr: str) -> Any:
+        """Resolve the structlog logger on first use and delegate to it."""
+        if self._logger is None:
+            self._logger = get_logger(self._name)
+        return getattr(self._logger, attr)
+
+
 class LogContext:
     """Context manager for adding structured log context."""
 
-    def __init__(self, logger: structlog.stdlib.BoundLogger, **context: Any):
+    def __init__(self, logger: "structlog.stdlib.BoundLogger", **context: Any):
         """Initialize log context.
 
         Args:
@@ -111,7 +180,7 @@ class LogContext:
         self.context = context
         self.bound_logger = None
 
-    def __enter__(self) -> structlog.stdlib.BoundLogger:
+    def __enter__(self) -> "structlog.stdlib.BoundLogger":
         """Enter context and return bound logger."""
         self.bound_logger = self.logger.bind(**self.context)
         return self.bound_logger
@@ -123,7 +192,7 @@ class LogContext:
 
 # Convenience function for common logging patterns
 def log_with_context(
-    logger: structlog.stdlib.BoundLogger,
+    logger: "structlog.stdlib.BoundLogger",
     level: str,
     message: str,
     **context: Any,
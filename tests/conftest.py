@@ -1,20 +1,105 @@
 """Pytest fixtures and configuration for muteme-btn-control tests."""
 
+import functools
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
-from typer.testing import CliRunner
+import typer
+from typer.testing import CliRunner, Result
 
-from muteme_btn.config import AppConfig
+from muteme_btn.config import AppConfig, AudioConfig
+from muteme_btn.hid.device import _gid_name, _invalidate_enumeration_cache, _uid_name
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_hid_enumeration_cache() -> Iterator[None]:
+    """Keep cached hid.enumerate() results from leaking between tests."""
+    _invalidate_enumeration_cache()
+    yield
+    _invalidate_enumeration_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_owner_name_cache() -> Iterator[None]:
+    """Keep cached UID/GID name lookups from leaking between tests."""
+    _uid_name.cache_clear()
+    _gid_name.cache_clear()
+    yield
+    _uid_name.cache_clear()
+    _gid_name.cache_clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def plain_terminal() -> Iterator[None]:
+    """Render CLI output as for a plain 120-column terminal, whatever the host's settings.
+
+    Session-scoped so session fixtures such as help_result see it too.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TERM", "dumb")
+        mp.setenv("NO_COLOR", "1")
+        mp.setenv("COLUMNS", "120")
+        yield
+
+
+class _FailFastCliRunner(CliRunner):
+    """CliRunner that lets unexpected exceptions propagate out of invoke().
+
+    SystemExit (including click usage errors) is still turned into an exit code;
+    pass catch_exceptions=True to capture other exceptions on the Result instead.
+    """
+
+    def invoke(self, *args: Any, **kwargs: Any) -> Result:
+        kwargs.setdefault("catch_exceptions", False)
+        return super().invoke(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """Create a Typer CLI test runner."""
-    return CliRunner()
+    """Create a Typer CLI test runner shared by the whole session.
+
+    invoke() sets up and tears down its own I/O isolation per call, so the runner
+    is reusable; tests must not stash state on it.
+    """
+    return _FailFastCliRunner()
+
+
+@pytest.fixture(scope="session")
+def app() -> typer.Typer:
+    """Return the CLI app, importing muteme_btn.cli only once a test needs it.
+
+    Modules that don't import the CLI themselves (e.g. test_cli_device.py) can use
+    this to avoid loading its import graph (audio backend, daemon) at collection.
+    """
+    from muteme_btn.cli import app as cli_app
+
+    return cli_app
+
+
+@pytest.fixture(scope="session")
+def help_result(runner: CliRunner, app: typer.Typer) -> Result:
+    """Invoke ``muteme-btn-control --help`` once and share the result."""
+    return runner.invoke(app, ["--help"])
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_audio_config(source_name: str | None = None, poll_interval: float = 0.1) -> AudioConfig:
+    """Build an AudioConfig shared by every caller with these arguments (read-only)."""
+    return AudioConfig(source_name=source_name, poll_interval=poll_interval)
+
+
+@pytest.fixture(scope="session")
+def audio_config_factory() -> Callable[..., AudioConfig]:
+    """Return a memoized AudioConfig builder keyed on its arguments.
+
+    Identical arguments yield the same instance across the session, so treat the
+    result as read-only.
+    """
+    return _cached_audio_config
 
 
 @pytest.fixture
@@ -24,18 +109,44 @@ def temp_dir() -> Iterator[Path]:
         yield Path(tmp_dir)
 
 
-@pytest.fixture
-def temp_config_file(temp_dir: Path) -> Path:
-    """Create a temporary configuration file."""
-    config_path = temp_dir / "test_config.toml"
+@pytest.fixture(scope="session")
+def base_app_config() -> AppConfig:
+    """Build a default AppConfig once per test session.
+
+    Treat it as read-only; derive variants with ``model_copy(update={...})``.
+    """
+    return AppConfig()
 
-    # Create a basic valid config
-    config = AppConfig()
-    config.to_toml_file(config_path)
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory: pytest.TempPathFactory, base_app_config: AppConfig) -> Path:
+    """Create a default configuration file once per test session.
+
+    Treat the file as read-only; tests that modify a config should write their own.
+    """
+    config_path = tmp_path_factory.mktemp("cfg") / "test_config.toml"
+    base_app_config.to_toml_file(config_path)
 
     return config_path
 
 
+@pytest.fixture
+def enumerate_by_vendor() -> Callable[[list[dict[str, Any]]], Callable[..., list[dict[str, Any]]]]:
+    """Build a hid.enumerate side effect that applies VID/PID filters like hidapi does."""
+
+    def factory(devices: list[dict[str, Any]]) -> Callable[..., list[dict[str, Any]]]:
+        def fake_enumerate(vendor_id: int = 0, product_id: int = 0) -> list[dict[str, Any]]:
+            return [
+                d
+                for d in devices
+                if vendor_id in (0, d["vendor_id"]) and product_id in (0, d["product_id"])
+            ]
+
+        return fake_enumerate
+
+    return factory
+
+
 @pytest.fixture
 def mock_hid_device():
     """Create a mock HID device for testing."""
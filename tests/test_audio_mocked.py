@@ -1,6 +1,6 @@
 """Mocked audio backend tests for CI and testing environments."""
 
-import copy
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -8,26 +8,41 @@ import pytest
 from muteme_btn.config import AudioConfig
 
 
+class PulseAudioError(Exception):
+    """Raised when mocked PulseAudio operations fail."""
+
+    __slots__ = ()
+
+
 class MockedPulseAudioBackend:
     """Mock implementation of PulseAudio backend for testing."""
 
-    def __init__(self, config: AudioConfig):
-        """Initialize mocked backend."""
-        self.config = config
-        self._mock_sources = [
+    # Read-only initial sources; each instance works on its own copies
+    _SOURCE_TEMPLATE = (
+        MappingProxyType(
             {
                 "name": "alsa_input.pci-0000_00_1b.0.analog-stereo",
                 "description": "Built-in Audio Analog Stereo",
                 "muted": False,
                 "index": 0,
-            },
+            }
+        ),
+        MappingProxyType(
             {
                 "name": "bluez_source.00_11_22_33_44_55.a2dp_source",
                 "description": "Bluetooth Microphone",
                 "muted": True,
                 "index": 1,
-            },
-        ]
+            }
+        ),
+    )
+
+    def __init__(self, config: AudioConfig):
+        """Initialize mocked backend."""
+        self.config = config
+        self._mock_sources = [dict(source) for source in self._SOURCE_TEMPLATE]
+        # Same dict objects as _mock_sources, keyed by name for direct lookup
+        self._by_name = {source["name"]: source for source in self._mock_sources}
         self._default_source_index = 0
         self._mute_state = False
         self._connected = True
@@ -35,45 +50,45 @@ class MockedPulseAudioBackend:
     def get_default_source(self) -> dict[str, Any]:
         """Get mocked default source."""
         if not self._connected:
-            raise Exception("Not connected to PulseAudio")
+            raise PulseAudioError("Not connected to PulseAudio")
         return self._mock_sources[self._default_source_index]
 
     def set_mute_state(self, source_name: str, muted: bool) -> None:
         """Set mocked mute state."""
         if not self._connected:
-            raise Exception("Not connected to PulseAudio")
+            raise PulseAudioError("Not connected to PulseAudio")
 
         if source_name is None:
             source_name = self.get_default_source()["name"]
 
-        for source in self._mock_sources:
-            if source["name"] == source_name:
-                source["muted"] = muted
-                if source["index"] == self._default_source_index:
-                    self._mute_state = muted
-                return
+        source = self._by_name.get(source_name)
+        if source is None:
+            raise PulseAudioError(f"Source '{source_name}' not found")
 
-        raise Exception(f"Source '{source_name}' not found")
+        source["muted"] = muted
+        if source["index"] == self._default_source_index:
+            self._mute_state = muted
 
     def is_muted(self, source_name: str) -> bool:
         """Check mocked mute state."""
         if not self._connected:
-            raise Exception("Not connected to PulseAudio")
+            raise PulseAudioError("Not connected to PulseAudio")
 
         if source_name is None:
             return self._mute_state
 
-        for source in self._mock_sources:
-            if source["name"] == source_name:
-                return bool(source["muted"])
+        source = self._by_name.get(source_name)
+        if source is None:
+            raise PulseAudioError(f"Source '{source_name}' not found")
 
-        raise Exception(f"Source '{source_name}' not found")
+        return bool(source["muted"])
 
     def list_sources(self) -> list[dict[str, Any]]:
         """List mocked sources."""
         if not self._connected:
-            raise Exception("Not connected to PulseAudio")
-        return copy.deepcopy(self._mock_sources)
+            raise PulseAudioError("Not connected to PulseAudio")
+        # Source dicts hold only scalars, so a per-dict copy is a full clone
+        return [dict(source) for source in self._mock_sources]
 
     def close(self) -> None:
         """Mock close connection."""
@@ -89,10 +104,11 @@ class MockedPulseAudioBackend:
 class TestMockedAudioBackend:
     """Test suite for mocked audio backend functionality."""
 
-    @pytest.fixture
-    def audio_config(self):
-        """Create test audio configuration."""
-        return AudioConfig(source_name=None, poll_interval=0.5)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def audio_config(cls, audio_config_factory):
+        """Create test audio configuration shared by the class (read-only)."""
+        return audio_config_factory(poll_interval=0.5)
 
     @pytest.fixture
     def mocked_backend(self, audio_config):
@@ -114,40 +130,47 @@ class TestMockedAudioBackend:
         assert source["muted"] is False
         assert source["index"] == 0
 
-    def test_mocked_set_mute_state_default_source(self, mocked_backend):
-        """Test setting mute state on default source."""
-        mocked_backend.set_mute_state(None, True)
-
-        assert mocked_backend.is_muted(None) is True
-        assert mocked_backend._mock_sources[0]["muted"] is True
-
-    def test_mocked_set_mute_state_specific_source(self, mocked_backend):
-        """Test setting mute state on specific source."""
-        mocked_backend.set_mute_state("bluez_source.00_11_22_33_44_55.a2dp_source", False)
-
-        assert mocked_backend.is_muted("bluez_source.00_11_22_33_44_55.a2dp_source") is False
-        assert mocked_backend._mock_sources[1]["muted"] is False
-
-    def test_mocked_set_mute_state_invalid_source(self, mocked_backend):
-        """Test setting mute state on invalid source raises exception."""
-        with pytest.raises(Exception, match="Source 'invalid_source' not found"):
-            mocked_backend.set_mute_state("invalid_source", True)
-
-    def test_mocked_is_muted_default_source(self, mocked_backend):
-        """Test checking mute state of default source."""
-        assert mocked_backend.is_muted(None) is False
-
-        mocked_backend.set_mute_state(None, True)
-        assert mocked_backend.is_muted(None) is True
-
-    def test_mocked_is_muted_specific_source(self, mocked_backend):
-        """Test checking mute state of specific source."""
-        assert mocked_backend.is_muted("bluez_source.00_11_22_33_44_55.a2dp_source") is True
-
-    def test_mocked_is_muted_invalid_source(self, mocked_backend):
-        """Test checking mute state of invalid source raises exception."""
-        with pytest.raises(Exception, match="Source 'invalid_source' not found"):
-            mocked_backend.is_muted("invalid_source")
+    @pytest.mark.parametrize(
+        ("source_name", "expected"),
+        [
+            (None, False),
+            ("alsa_input.pci-0000_00_1b.0.analog-stereo", False),
+            ("bluez_source.00_11_22_33_44_55.a2dp_source", True),
+        ],
+        ids=["default", "builtin", "bluetooth"],
+    )
+    def test_mocked_initial_mute_state(self, mocked_backend, source_name, expected):
+        """Test initial mute state of default and specific sources."""
+        assert mocked_backend.is_muted(source_name) is expected
+
+    @pytest.mark.parametrize(
+        ("source_name", "muted", "index"),
+        [
+            (None, True, 0),
+            ("alsa_input.pci-0000_00_1b.0.analog-stereo", True, 0),
+            ("bluez_source.00_11_22_33_44_55.a2dp_source", False, 1),
+        ],
+        ids=["default", "builtin", "bluetooth"],
+    )
+    def test_mocked_set_mute_state(self, mocked_backend, source_name, muted, index):
+        """Test setting mute state on default and specific sources."""
+        mocked_backend.set_mute_state(source_name, muted)
+
+        assert mocked_backend.is_muted(source_name) is muted
+        assert mocked_backend._mock_sources[index]["muted"] is muted
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda backend: backend.set_mute_state("invalid_source", True),
+            lambda backend: backend.is_muted("invalid_source"),
+        ],
+        ids=["set_mute_state", "is_muted"],
+    )
+    def test_mocked_invalid_source(self, mocked_backend, operation):
+        """Test operations on an invalid source raise exception."""
+        with pytest.raises(PulseAudioError, match="Source 'invalid_source' not found"):
+            operation(mocked_backend)
 
     def test_mocked_list_sources(self, mocked_backend):
         """Test listing all sources."""
@@ -164,7 +187,7 @@ class TestMockedAudioBackend:
         assert mocked_backend._connected is False
 
         # Operations should fail after closing
-        with pytest.raises(Exception, match="Not connected to PulseAudio"):
+        with pytest.raises(PulseAudioError, match="Not connected to PulseAudio"):
             mocked_backend.get_default_source()
 
     def test_mocked_context_manager(self, audio_config):
@@ -177,21 +200,22 @@ class TestMockedAudioBackend:
         # Should be closed after context
         assert backend._connected is False
 
-    def test_mocked_disconnected_operations(self, mocked_backend):
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda backend: backend.get_default_source(),
+            lambda backend: backend.set_mute_state(None, True),
+            lambda backend: backend.is_muted(None),
+            lambda backend: backend.list_sources(),
+        ],
+        ids=["get_default_source", "set_mute_state", "is_muted", "list_sources"],
+    )
+    def test_mocked_disconnected_operations(self, mocked_backend, operation):
         """Test operations fail when disconnected."""
         mocked_backend.close()
 
-        with pytest.raises(Exception, match="Not connected to PulseAudio"):
-            mocked_backend.get_default_source()
-
-        with pytest.raises(Exception, match="Not connected to PulseAudio"):
-            mocked_backend.set_mute_state(None, True)
-
-        with pytest.raises(Exception, match="Not connected to PulseAudio"):
-            mocked_backend.is_muted(None)
-
-        with pytest.raises(Exception, match="Not connected to PulseAudio"):
-            mocked_backend.list_sources()
+        with pytest.raises(PulseAudioError, match="Not connected to PulseAudio"):
+            operation(mocked_backend)
 
     def test_mocked_multiple_mute_operations(self, mocked_backend):
         """Test multiple mute operations work correctly."""
@@ -1,46 +1,76 @@
 """Tests for PulseAudio backend implementation."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
+from pulsectl import Pulse  # bound before _patch_pulse swaps the module attribute
 
 from muteme_btn.audio.pulse import PulseAudioBackend
 from muteme_btn.config import AudioConfig
 
+# Attributes PulseAudioBackend reads from a pulsectl source object
+_SOURCE_FIELDS = ["name", "description", "mute", "index"]
+
+
+def _mock_source(**attrs):
+    """Build a pulsectl source stand-in limited to the fields the backend reads.
+
+    ``name`` is a reserved Mock() keyword, so attributes go through configure_mock.
+    """
+    source = Mock(spec_set=_SOURCE_FIELDS)
+    source.configure_mock(**attrs)
+    return source
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_pulse():
+    """Patch pulsectl.Pulse once for the whole module."""
+    mock_cls = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("muteme_btn.audio.pulse.pulsectl.Pulse", mock_cls)
+        yield mock_cls
+
+
+@pytest.fixture
+def mock_pulse(_patch_pulse):
+    """Reset the module-wide Pulse mock and give it a fresh instance.
+
+    The instance is spec_set to the real Pulse class, so calls to methods pulsectl
+    does not have fail instead of silently returning child mocks.
+    """
+    _patch_pulse.reset_mock(side_effect=True)
+    _patch_pulse.return_value = Mock(spec_set=Pulse)
+    return _patch_pulse
+
 
 class TestPulseAudioBackend:
     """Test suite for PulseAudio backend."""
 
-    @pytest.fixture
-    def audio_config(self):
-        """Create a test audio configuration."""
-        return AudioConfig()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def audio_config(cls, audio_config_factory):
+        """Create a test audio configuration shared by the class (read-only)."""
+        return audio_config_factory()
 
     @pytest.fixture
-    def backend(self, audio_config):
+    def backend(self, audio_config, mock_pulse):
         """Create a PulseAudio backend instance with mocked pulsectl."""
-        with patch("muteme_btn.audio.pulse.pulsectl.Pulse") as mock_pulse:
-            mock_instance = Mock()
-            mock_pulse.return_value = mock_instance
-            backend = PulseAudioBackend(audio_config)
-            backend._pulse = mock_instance
-            return backend
-
-    def test_backend_initialization(self, audio_config):
+        return PulseAudioBackend(audio_config)
+
+    def test_backend_initialization(self, audio_config, mock_pulse):
         """Test backend initializes with correct configuration."""
-        with patch("muteme_btn.audio.pulse.pulsectl.Pulse") as mock_pulse:
-            backend = PulseAudioBackend(audio_config)
-            mock_pulse.assert_called_once_with("muteme-btn-control")
-            assert backend.config == audio_config
+        backend = PulseAudioBackend(audio_config)
+        mock_pulse.assert_called_once_with("muteme-btn-control")
+        assert backend.config == audio_config
 
     def test_get_default_source_success(self, backend):
         """Test getting default source information."""
-        # Mock source object
-        mock_source = Mock()
-        mock_source.name = "alsa_input.pci-0000_00_1b.0.analog-stereo"
-        mock_source.description = "Built-in Audio Analog Stereo"
-        mock_source.mute = 0
-        mock_source.index = 0
+        mock_source = _mock_source(
+            name="alsa_input.pci-0000_00_1b.0.analog-stereo",
+            description="Built-in Audio Analog Stereo",
+            mute=0,
+            index=0,
+        )
 
         backend._pulse.get_source_by_name.return_value = mock_source
 
@@ -58,85 +88,60 @@ class TestPulseAudioBackend:
         with pytest.raises(Exception, match="Source not found"):
             backend.get_default_source()
 
-    def test_set_mute_state_mute(self, backend):
-        """Test muting a source."""
-        mock_source = Mock()
-        mock_source.index = 0
+    @pytest.mark.parametrize(
+        ("muted", "index"),
+        [(True, 0), (False, 1)],
+        ids=["mute", "unmute"],
+    )
+    def test_set_mute_state(self, backend, muted, index):
+        """Test muting and unmuting a source."""
+        mock_source = _mock_source(index=index)
         backend._pulse.get_source_by_name.return_value = mock_source
 
-        backend.set_mute_state("test_source", True)
+        backend.set_mute_state("test_source", muted)
 
         backend._pulse.get_source_by_name.assert_called_once_with("test_source")
-        backend._pulse.source_mute.assert_called_once_with(mock_source.index, True)
+        backend._pulse.source_mute.assert_called_once_with(index, muted)
 
-    def test_set_mute_state_unmute(self, backend):
-        """Test unmuting a source."""
-        mock_source = Mock()
-        mock_source.index = 1
-        backend._pulse.get_source_by_name.return_value = mock_source
-
-        backend.set_mute_state("test_source", False)
-
-        backend._pulse.get_source_by_name.assert_called_once_with("test_source")
-        backend._pulse.source_mute.assert_called_once_with(mock_source.index, False)
-
-    def test_set_mute_state_default_source(self, backend):
+    def test_set_mute_state_default_source(self, backend, monkeypatch):
         """Test muting/unmuting default source when no source specified."""
-        mock_source = Mock()
-        mock_source.name = "default_source"
-        mock_source.index = 2
+        mock_source = _mock_source(name="default_source", index=2)
         backend._pulse.get_source_by_name.return_value = mock_source
 
         # Mock the default source lookup
-        with patch.object(backend, "get_default_source", return_value={"name": "default_source"}):
-            backend.set_mute_state(None, True)
+        monkeypatch.setattr(backend, "get_default_source", lambda: {"name": "default_source"})
+        backend.set_mute_state(None, True)
 
         backend._pulse.source_mute.assert_called_once_with(2, True)
 
-    def test_is_muted_true(self, backend):
-        """Test checking if source is muted (returns True)."""
-        mock_source = Mock()
-        mock_source.mute = 1  # pulsectl uses 1 for muted
+    @pytest.mark.parametrize(
+        ("mute", "expected"),
+        [(1, True), (0, False)],
+        ids=["muted", "unmuted"],
+    )
+    def test_is_muted(self, backend, mute, expected):
+        """Test checking if a source is muted (pulsectl uses 1/0 for muted/unmuted)."""
+        mock_source = _mock_source(mute=mute)
         backend._pulse.get_source_by_name.return_value = mock_source
 
         result = backend.is_muted("test_source")
 
-        assert result is True
+        assert result is expected
 
-    def test_is_muted_false(self, backend):
-        """Test checking if source is muted (returns False)."""
-        mock_source = Mock()
-        mock_source.mute = 0  # pulsectl uses 0 for unmuted
-        backend._pulse.get_source_by_name.return_value = mock_source
-
-        result = backend.is_muted("test_source")
-
-        assert result is False
-
-    def test_is_muted_default_source(self, backend):
+    def test_is_muted_default_source(self, backend, monkeypatch):
         """Test checking mute status of default source."""
-        mock_source = Mock()
-        mock_source.mute = 1
+        mock_source = _mock_source(mute=1)
         backend._pulse.get_source_by_name.return_value = mock_source
 
-        with patch.object(backend, "get_default_source", return_value={"name": "default_source"}):
-            result = backend.is_muted(None)
+        monkeypatch.setattr(backend, "get_default_source", lambda: {"name": "default_source"})
+        result = backend.is_muted(None)
 
         assert result is True
 
     def test_list_sources(self, backend):
         """Test listing all available sources."""
-        mock_source1 = Mock()
-        mock_source1.name = "source1"
-        mock_source1.description = "Test Source 1"
-        mock_source1.mute = 0
-        mock_source1.index = 0
-
-        mock_source2 = Mock()
-        mock_source2.name = "source2"
-        mock_source2.description = "Test Source 2"
-        mock_source2.mute = 1
-        mock_source2.index = 1
+        mock_source1 = _mock_source(name="source1", description="Test Source 1", mute=0, index=0)
+        mock_source2 = _mock_source(name="source2", description="Test Source 2", mute=1, index=1)
 
         backend._pulse.source_list.return_value = [mock_source1, mock_source2]
 
@@ -148,29 +153,25 @@ class TestPulseAudioBackend:
         assert result[1]["name"] == "source2"
         assert result[1]["muted"] is True
 
-    def test_context_manager(self, audio_config):
+    def test_context_manager(self, audio_config, mock_pulse):
         """Test backend works as context manager."""
-        with patch("muteme_btn.audio.pulse.pulsectl.Pulse") as mock_pulse:
-            mock_instance = Mock()
-            mock_pulse.return_value = mock_instance
+        mock_instance = mock_pulse.return_value
 
-            with PulseAudioBackend(audio_config) as backend:
-                assert backend._pulse == mock_instance
+        with PulseAudioBackend(audio_config) as backend:
+            assert backend._pulse == mock_instance
 
-            mock_instance.close.assert_called_once()
+        mock_instance.close.assert_called_once()
 
-    def test_connection_error_handling(self, audio_config):
+    def test_connection_error_handling(self, audio_config, mock_pulse):
         """Test handling of PulseAudio connection errors."""
-        with patch(
-            "muteme_btn.audio.pulse.pulsectl.Pulse", side_effect=Exception("Connection failed")
-        ):
-            with pytest.raises(Exception, match="Connection failed"):
-                PulseAudioBackend(audio_config)
+        mock_pulse.side_effect = Exception("Connection failed")
+
+        with pytest.raises(Exception, match="Connection failed"):
+            PulseAudioBackend(audio_config)
 
-    def test_specific_source_config(self):
+    def test_specific_source_config(self, mock_pulse):
         """Test backend with specific source configuration."""
         config = AudioConfig(source_name="specific_source")
 
-        with patch("muteme_btn.audio.pulse.pulsectl.Pulse"):
-            backend = PulseAudioBackend(config)
-            assert backend.config.source_name == "specific_source"
+        backend = PulseAudioBackend(config)
+        assert backend.config.source_name == "specific_source"
@@ -15,6 +15,54 @@ from muteme_btn.config import (
 )
 
 
+@pytest.fixture(scope="module")
+def toml_corpus(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write the TOML files the loading tests read, once per module.
+
+    Keys: ``valid`` (non-default values in every section) and ``invalid_syntax``.
+    Treat the files as read-only.
+    """
+    corpus_dir = tmp_path_factory.mktemp("toml_corpus")
+    corpus = {name: corpus_dir / f"{name}.toml" for name in ("valid", "invalid_syntax")}
+
+    with open(corpus["valid"], "w") as f:
+        toml.dump(
+            {
+                "daemon": True,
+                "device": {"vid": 0x1234, "pid": 0x5678, "timeout": 10.0},
+                "audio": {
+                    "backend": "pipewire",
+                    "source_name": "test_source",
+                    "poll_interval": 0.5,
+                },
+                "logging": {
+                    "level": "DEBUG",
+                    "format": "json",
+                    "max_file_size": 2097152,
+                    "backup_count": 10,
+                },
+            },
+            f,
+        )
+
+    corpus["invalid_syntax"].write_text("invalid toml content [[[")
+
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def custom_app_config(base_app_config: AppConfig) -> AppConfig:
+    """Build an AppConfig with a non-default value in every section (read-only)."""
+    return base_app_config.model_copy(
+        update={
+            "daemon": True,
+            "device": DeviceConfig(vid=0x1234),
+            "audio": AudioConfig(backend="pipewire"),
+            "logging": LoggingConfig(level=LogLevel.DEBUG),
+        }
+    )
+
+
 class TestDeviceConfig:
     """Test suite for DeviceConfig."""
 
@@ -105,6 +153,7 @@ class TestLoggingConfig:
         assert config.max_file_size == 2097152
         assert config.backup_count == 10
 
+    @pytest.mark.integration
     def test_logging_config_validation(self, temp_dir: Path) -> None:
         """Test logging configuration validation."""
         # Test file_path validation - non-existent directory
@@ -163,28 +212,9 @@ class TestAppConfig:
         with pytest.raises(ValueError):
             AppConfig(invalid_field="should_fail")  # type: ignore[call-arg]
 
-    def test_from_toml_file_success(self, temp_dir: Path) -> None:
+    def test_from_toml_file_success(self, toml_corpus: dict[str, Path]) -> None:
         """Test successful loading from TOML file."""
-        config_path = temp_dir / "test_config.toml"
-
-        # Create a test TOML file
-        test_config = {
-            "daemon": True,
-            "device": {"vid": 0x1234, "pid": 0x5678, "timeout": 10.0},
-            "audio": {"backend": "pipewire", "source_name": "test_source", "poll_interval": 0.5},
-            "logging": {
-                "level": "DEBUG",
-                "format": "json",
-                "max_file_size": 2097152,
-                "backup_count": 10,
-            },
-        }
-
-        with open(config_path, "w") as f:
-            toml.dump(test_config, f)
-
-        # Load the configuration
-        config = AppConfig.from_toml_file(config_path)
+        config = AppConfig.from_toml_file(toml_corpus["valid"])
 
         assert config.daemon is True
         assert config.device.vid == 0x1234
@@ -204,48 +234,32 @@ class TestAppConfig:
         with pytest.raises(FileNotFoundError, match="Configuration file not found"):
             AppConfig.from_toml_file(non_existent_path)
 
-    def test_from_toml_file_invalid_toml(self, temp_dir: Path) -> None:
+    def test_from_toml_file_invalid_toml(self, toml_corpus: dict[str, Path]) -> None:
         """Test loading from invalid TOML file."""
-        config_path = temp_dir / "invalid_config.toml"
-
-        # Write invalid TOML
-        with open(config_path, "w") as f:
-            f.write("invalid toml content [[[")
-
         with pytest.raises(ValueError, match="Invalid configuration file"):
-            AppConfig.from_toml_file(config_path)
+            AppConfig.from_toml_file(toml_corpus["invalid_syntax"])
 
-    def test_from_toml_file_invalid_config_data(self, temp_dir: Path) -> None:
-        """Test loading TOML file with invalid configuration data."""
-        config_path = temp_dir / "invalid_data_config.toml"
-
-        # Create TOML with invalid data (violates validation rules)
-        test_config = {
-            "device": {
-                "timeout": 0.05  # Too small, should fail validation
-            }
-        }
+    def test_from_toml_str_success(self) -> None:
+        """Test loading configuration from in-memory TOML text."""
+        config = AppConfig.from_toml_str('daemon = true\n\n[audio]\nsource_name = "test_source"\n')
 
-        with open(config_path, "w") as f:
-            toml.dump(test_config, f)
+        assert config.daemon is True
+        assert config.audio.source_name == "test_source"
+        assert config.device == DeviceConfig()
 
-        with pytest.raises(ValueError, match="Invalid configuration file"):
-            AppConfig.from_toml_file(config_path)
+    def test_from_toml_str_invalid_config_data(self) -> None:
+        """Test loading TOML text with invalid configuration data."""
+        # Timeout too small, should fail validation
+        with pytest.raises(ValueError, match="Invalid configuration file <string>"):
+            AppConfig.from_toml_str("[device]\ntimeout = 0.05\n")
 
-    def test_to_toml_file(self, temp_dir: Path) -> None:
+    @pytest.mark.integration
+    def test_to_toml_file(self, temp_dir: Path, custom_app_config: AppConfig) -> None:
         """Test saving configuration to TOML file."""
         config_path = temp_dir / "output_config.toml"
 
-        # Create a config
-        original_config = AppConfig(
-            daemon=True,
-            device=DeviceConfig(vid=0x1234),
-            audio=AudioConfig(backend="pipewire"),
-            logging=LoggingConfig(level=LogLevel.DEBUG),
-        )
-
         # Save it
-        original_config.to_toml_file(config_path)
+        custom_app_config.to_toml_file(config_path)
 
         # Verify file exists and has content
         assert config_path.exists()
@@ -257,7 +271,10 @@ class TestAppConfig:
         assert loaded_config.audio.backend == "pipewire"
         assert loaded_config.logging.level == LogLevel.DEBUG
 
-    def test_to_toml_file_creates_directory(self, temp_dir: Path) -> None:
+    @pytest.mark.integration
+    def test_to_toml_file_creates_directory(
+        self, temp_dir: Path, base_app_config: AppConfig
+    ) -> None:
         """Test that to_toml_file creates parent directories."""
         config_path = temp_dir / "nested" / "dir" / "config.toml"
 
@@ -265,8 +282,7 @@ class TestAppConfig:
         assert not config_path.parent.exists()
 
         # Save config
-        config = AppConfig()
-        config.to_toml_file(config_path)
+        base_app_config.to_toml_file(config_path)
 
         # Verify directory was created and file exists
         assert config_path.exists()
@@ -278,16 +294,17 @@ class TestConfigEnums:
 
     def test_log_level_values(self) -> None:
         """Test LogLevel enum values."""
-        assert LogLevel.DEBUG == "DEBUG"
-        assert LogLevel.INFO == "INFO"
-        assert LogLevel.WARNING == "WARNING"
-        assert LogLevel.ERROR == "ERROR"
-        assert LogLevel.CRITICAL == "CRITICAL"
+        assert {level.name: level.value for level in LogLevel} == {
+            "DEBUG": "DEBUG",
+            "INFO": "INFO",
+            "WARNING": "WARNING",
+            "ERROR": "ERROR",
+            "CRITICAL": "CRITICAL",
+        }
 
     def test_log_format_values(self) -> None:
         """Test LogFormat enum values."""
-        assert LogFormat.TEXT == "text"
-        assert LogFormat.JSON == "json"
+        assert {fmt.name: fmt.value for fmt in LogFormat} == {"TEXT": "text", "JSON": "json"}
 
     def test_enum_serialization(self) -> None:
         """Test that enums serialize correctly."""
@@ -1,53 +1,55 @@
 """Tests for main daemon orchestration with asyncio."""
 
 import asyncio
-from datetime import datetime
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from muteme_btn.config import AudioConfig, DeviceConfig
 from muteme_btn.core.daemon import MuteMeDaemon
-from muteme_btn.hid.device import DeviceError
+from muteme_btn.hid.device import DeviceError, DeviceEvent
 
 
 class TestMuteMeDaemon:
     """Test suite for MuteMe daemon."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_device(self):
-        """Create a mock HID device."""
+        """Create a mock HID device, shared across the module."""
         device = Mock()
-        device.is_connected = Mock(return_value=True)
         device.read_events = AsyncMock()
-        device.close = Mock()
         return device
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_audio_backend(self):
-        """Create a mock audio backend."""
-        backend = Mock()
-        backend.is_muted = Mock(return_value=False)
-        backend.set_mute_state = Mock()
-        backend.close = Mock()
-        return backend
+        """Create a mock audio backend, shared across the module."""
+        return Mock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_state_machine(self):
-        """Create a mock button state machine."""
-        sm = Mock()
-        sm.process_event = Mock(return_value=[])
-        sm.reset = Mock()
-        return sm
+        """Create a mock button state machine, shared across the module."""
+        return Mock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_led_controller(self):
-        """Create a mock LED feedback controller."""
-        controller = Mock()
-        controller.update_led_to_mute_status = Mock()
-        controller.force_led_color = Mock()
-        controller.set_device = Mock()
-        return controller
+        """Create a mock LED feedback controller, shared across the module."""
+        return Mock()
+
+    @pytest.fixture(autouse=True)
+    def reset_shared_mocks(
+        self, mock_device, mock_audio_backend, mock_state_machine, mock_led_controller
+    ):
+        """Reset the shared mocks and restore their default behavior before each test.
+
+        Clearing return values and side effects here means tests that make a mock
+        raise (e.g. test_cleanup_with_errors) cannot leak into later tests.
+        """
+        for mock in (mock_device, mock_audio_backend, mock_state_machine, mock_led_controller):
+            mock.reset_mock(return_value=True, side_effect=True)
+        mock_device.is_connected.return_value = True
+        mock_audio_backend.is_muted.return_value = False
+        mock_state_machine.process_event.return_value = []
 
     @pytest.fixture
     def daemon(self, mock_device, mock_audio_backend, mock_state_machine, mock_led_controller):
@@ -116,14 +118,8 @@ class TestMuteMeDaemon:
     @pytest.mark.asyncio
     async def test_process_button_events(self, daemon, mock_state_machine):
         """Test processing button events from device."""
-        # Mock button events
-        press_event = Mock()
-        press_event.type = "press"
-        press_event.timestamp = datetime.now()
-
-        release_event = Mock()
-        release_event.type = "release"
-        release_event.timestamp = datetime.now()
+        press_event = DeviceEvent(type="press", timestamp_ns=time.monotonic_ns())
+        release_event = DeviceEvent(type="release", timestamp_ns=time.monotonic_ns())
 
         daemon.device.read_events.return_value = [press_event, release_event]
 
@@ -161,6 +157,42 @@ class TestMuteMeDaemon:
 
         mock_led_controller.update_led_to_mute_status.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_led_feedback_reuses_cached_mute_state(
+        self, daemon, mock_audio_backend, mock_led_controller
+    ):
+        """Test back-to-back LED refreshes query the audio backend only once."""
+        await daemon._update_led_feedback()
+        await daemon._update_led_feedback()
+
+        mock_audio_backend.is_muted.assert_called_once()
+        mock_led_controller.update_led_to_mute_status.assert_called_with(False)
+
+    @pytest.mark.asyncio
+    async def test_update_led_feedback_requeries_after_cache_expires(
+        self, daemon, mock_audio_backend, mock_led_controller
+    ):
+        """Test an expired mute cache picks up changes made outside the daemon."""
+        await daemon._update_led_feedback()
+        mock_audio_backend.is_muted.return_value = True
+        daemon._cache_valid_until_ns = 0
+
+        await daemon._update_led_feedback()
+
+        assert mock_audio_backend.is_muted.call_count == 2
+        mock_led_controller.update_led_to_mute_status.assert_called_with(True)
+
+    @pytest.mark.asyncio
+    async def test_toggle_action_updates_cached_mute_state(
+        self, daemon, mock_audio_backend, mock_led_controller
+    ):
+        """Test toggling records the new mute state instead of re-reading it."""
+        await daemon._handle_action("toggle")
+
+        mock_audio_backend.set_mute_state.assert_called_once_with(None, True)
+        mock_audio_backend.is_muted.assert_called_once()
+        mock_led_controller.update_led_to_mute_status.assert_called_once_with(True)
+
     @pytest.mark.asyncio
     async def test_update_led_feedback_with_error(self, daemon, mock_led_controller):
         """Test handling LED feedback errors gracefully."""
@@ -175,9 +207,7 @@ class TestMuteMeDaemon:
         # Mock individual components
         daemon._process_button_events = AsyncMock()
         daemon._update_led_feedback = AsyncMock()
-        # Set running state using the lock for thread safety
-        async with daemon._running_lock:
-            daemon.running = True
+        daemon.running = True
 
         # Mock asyncio.sleep to avoid actual delays
         with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
@@ -264,13 +294,11 @@ class TestMuteMeDaemon:
     async def test_rapid_button_presses(self, daemon, mock_state_machine):
         """Test handling multiple rapid button presses (stress test)."""
         # Create many rapid button events
-        events = []
-        base_time = datetime.now()
-        for i in range(50):
-            event = Mock()
-            event.type = "press" if i % 2 == 0 else "release"
-            event.timestamp = base_time
-            events.append(event)
+        base_time = time.monotonic_ns()
+        events = [
+            DeviceEvent(type="press" if i % 2 == 0 else "release", timestamp_ns=base_time)
+            for i in range(50)
+        ]
 
         daemon.device.read_events.return_value = events
         daemon.device.is_connected.return_value = True
@@ -343,9 +371,7 @@ class TestMuteMeDaemon:
 
         daemon._process_button_events = AsyncMock()
         daemon._update_led_feedback = AsyncMock()
-        # Set running state using the lock for thread safety
-        async with daemon._running_lock:
-            daemon.running = True
+        daemon.running = True
 
         # Mock asyncio.sleep to verify timing
         sleep_calls = []
@@ -365,6 +391,26 @@ class TestMuteMeDaemon:
             assert len(sleep_calls) > 0
             assert sleep_calls[0] == 0.02
 
+    @pytest.mark.asyncio
+    async def test_main_loop_caps_poll_interval_at_timeout(self, daemon):
+        """Test the pause between polls never exceeds the configured poll timeout."""
+        daemon.device_config.poll_interval_ms = 500
+        daemon.device_config.poll_timeout_ms = 100
+
+        daemon._process_button_events = AsyncMock()
+        daemon._update_led_feedback = AsyncMock()
+        daemon.running = True
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_sleep.side_effect = asyncio.CancelledError()
+
+            try:
+                await daemon._main_loop()
+            except asyncio.CancelledError:
+                pass
+
+            mock_sleep.assert_awaited_once_with(0.1)
+
     @pytest.mark.asyncio
     async def test_concurrent_start_stop(self, daemon):
         """Test concurrent start/stop operations are handled safely."""
@@ -404,8 +450,11 @@ class TestMuteMeDaemon:
         daemon._connect_device = AsyncMock(side_effect=connect_side_effect)
         daemon._update_led_feedback = AsyncMock()
 
-        await daemon._attempt_reconnect_if_needed()
+        # Skip the real post-connect settle delay
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await daemon._attempt_reconnect_if_needed()
 
+        mock_sleep.assert_awaited_once_with(0.1)
         daemon._connect_device.assert_called_once()
         daemon.led_controller.set_device.assert_called_once_with(reconnected_device)
         daemon._update_led_feedback.assert_awaited_once()
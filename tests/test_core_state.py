@@ -1,11 +1,13 @@
 """Tests for button state machine implementation."""
 
-from datetime import datetime, timedelta
+import time
 
 import pytest
 
 from muteme_btn.core.state import ButtonEvent, ButtonState, ButtonStateMachine
 
+_MS = 1_000_000  # nanoseconds per millisecond
+
 
 class TestButtonStateMachine:
     """Test suite for button state machine."""
@@ -23,23 +25,23 @@ class TestButtonStateMachine:
 
     def test_button_press_in_idle_state(self, state_machine):
         """Test handling button press from IDLE state."""
-        event = ButtonEvent(type="press", timestamp=datetime.now())
+        event = ButtonEvent(type="press", timestamp_ns=time.monotonic_ns())
 
         actions = state_machine.process_event(event)
 
         assert state_machine.current_state == ButtonState.PRESSED
-        assert state_machine.last_press_time == event.timestamp
+        assert state_machine.last_press_ns == event.timestamp_ns
         assert state_machine.press_count == 1
         assert actions == []  # No actions on press
 
     def test_button_release_in_pressed_state(self, state_machine):
         """Test handling button release from PRESSED state."""
         # First press to get into PRESSED state
-        press_event = ButtonEvent(type="press", timestamp=datetime.now())
+        press_event = ButtonEvent(type="press", timestamp_ns=time.monotonic_ns())
         state_machine.process_event(press_event)
 
         # Now release
-        release_event = ButtonEvent(type="release", timestamp=datetime.now())
+        release_event = ButtonEvent(type="release", timestamp_ns=time.monotonic_ns())
         actions = state_machine.process_event(release_event)
 
         assert state_machine.current_state == ButtonState.IDLE
@@ -47,15 +49,15 @@ class TestButtonStateMachine:
 
     def test_toggle_action_on_complete_press(self, state_machine):
         """Test that toggle action is triggered on complete press-release cycle."""
-        press_time = datetime.now()
-        release_time = press_time + timedelta(milliseconds=100)
+        press_time = time.monotonic_ns()
+        release_time = press_time + 100 * _MS
 
         # Press
-        press_event = ButtonEvent(type="press", timestamp=press_time)
+        press_event = ButtonEvent(type="press", timestamp_ns=press_time)
         state_machine.process_event(press_event)
 
         # Release - should trigger toggle
-        release_event = ButtonEvent(type="release", timestamp=release_time)
+        release_event = ButtonEvent(type="release", timestamp_ns=release_time)
         actions = state_machine.process_event(release_event)
 
         assert "toggle" in actions
@@ -63,18 +65,18 @@ class TestButtonStateMachine:
 
     def test_double_tap_detection(self, state_machine):
         """Test double-tap detection within timeout window."""
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         # First press-release cycle
-        press1 = ButtonEvent(type="press", timestamp=now)
+        press1 = ButtonEvent(type="press", timestamp_ns=now)
         state_machine.process_event(press1)
-        release1 = ButtonEvent(type="release", timestamp=now + timedelta(milliseconds=100))
+        release1 = ButtonEvent(type="release", timestamp_ns=now + 100 * _MS)
         state_machine.process_event(release1)
 
         # Second press within double-tap window (300ms)
-        press2 = ButtonEvent(type="press", timestamp=now + timedelta(milliseconds=200))
+        press2 = ButtonEvent(type="press", timestamp_ns=now + 200 * _MS)
         state_machine.process_event(press2)
-        release2 = ButtonEvent(type="release", timestamp=now + timedelta(milliseconds=300))
+        release2 = ButtonEvent(type="release", timestamp_ns=now + 300 * _MS)
         actions = state_machine.process_event(release2)
 
         # After double-tap detection, press_count is reset to 0
@@ -85,16 +87,16 @@ class TestButtonStateMachine:
 
     def test_timeout_handling(self, state_machine):
         """Test timeout resets press count."""
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         # Press and release
-        press = ButtonEvent(type="press", timestamp=now)
+        press = ButtonEvent(type="press", timestamp_ns=now)
         state_machine.process_event(press)
-        release = ButtonEvent(type="release", timestamp=now + timedelta(milliseconds=100))
+        release = ButtonEvent(type="release", timestamp_ns=now + 100 * _MS)
         state_machine.process_event(release)
 
         # Simulate timeout by processing a time-based event
-        timeout_event = ButtonEvent(type="timeout", timestamp=now + timedelta(seconds=1))
+        timeout_event = ButtonEvent(type="timeout", timestamp_ns=now + 1000 * _MS)
         state_machine.process_event(timeout_event)
 
         assert state_machine.press_count == 0
@@ -102,11 +104,11 @@ class TestButtonStateMachine:
 
     def test_debounce_ignores_rapid_events(self, state_machine):
         """Test that very rapid events are debounced."""
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         # Rapid press events within 10ms
-        press1 = ButtonEvent(type="press", timestamp=now)
-        press2 = ButtonEvent(type="press", timestamp=now + timedelta(milliseconds=5))
+        press1 = ButtonEvent(type="press", timestamp_ns=now)
+        press2 = ButtonEvent(type="press", timestamp_ns=now + 5 * _MS)
 
         state_machine.process_event(press1)
         # Second press should be ignored due to debouncing
@@ -121,10 +123,10 @@ class TestButtonStateMachine:
         This tests the edge case where a second press arrives before the release,
         which can happen with hardware edge cases or missed release events.
         """
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         # First press - enters PRESSED state
-        press1 = ButtonEvent(type="press", timestamp=now)
+        press1 = ButtonEvent(type="press", timestamp_ns=now)
         state_machine.process_event(press1)
         assert state_machine.current_state == ButtonState.PRESSED
         assert state_machine.press_count == 1
@@ -132,7 +134,7 @@ class TestButtonStateMachine:
         # Second press while still in PRESSED state
         # (after debounce threshold but within double-tap window)
         # Use 50ms - enough to pass debounce (10ms) but within double-tap timeout (300ms)
-        press2 = ButtonEvent(type="press", timestamp=now + timedelta(milliseconds=50))
+        press2 = ButtonEvent(type="press", timestamp_ns=now + 50 * _MS)
         actions = state_machine.process_event(press2)
 
         # Should increment press_count and remain in PRESSED state
@@ -141,7 +143,7 @@ class TestButtonStateMachine:
         assert not actions  # No actions until release
 
         # Now release - should trigger double-tap
-        release = ButtonEvent(type="release", timestamp=now + timedelta(milliseconds=100))
+        release = ButtonEvent(type="release", timestamp_ns=now + 100 * _MS)
         actions = state_machine.process_event(release)
 
         # Should detect double-tap and return to IDLE
@@ -152,15 +154,15 @@ class TestButtonStateMachine:
 
     def test_press_while_pressed_exceeds_timeout(self, state_machine):
         """Test press while PRESSED that exceeds double-tap timeout is treated as new sequence."""
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         # First press
-        press1 = ButtonEvent(type="press", timestamp=now)
+        press1 = ButtonEvent(type="press", timestamp_ns=now)
         state_machine.process_event(press1)
         assert state_machine.press_count == 1
 
         # Second press after timeout window (> 300ms)
-        press2 = ButtonEvent(type="press", timestamp=now + timedelta(milliseconds=400))
+        press2 = ButtonEvent(type="press", timestamp_ns=now + 400 * _MS)
         state_machine.process_event(press2)
 
         # Should reset press_count to 1 (new sequence)
@@ -168,7 +170,7 @@ class TestButtonStateMachine:
         assert state_machine.press_count == 1
 
         # Release should only trigger single toggle, not double-tap
-        release = ButtonEvent(type="release", timestamp=now + timedelta(milliseconds=500))
+        release = ButtonEvent(type="release", timestamp_ns=now + 500 * _MS)
         actions = state_machine.process_event(release)
 
         assert state_machine.current_state == ButtonState.IDLE
@@ -177,17 +179,27 @@ class TestButtonStateMachine:
 
     def test_invalid_event_handling(self, state_machine):
         """Test handling of unknown event types."""
-        invalid_event = ButtonEvent(type="unknown", timestamp=datetime.now())
+        invalid_event = ButtonEvent(type="unknown", timestamp_ns=time.monotonic_ns())
 
         actions = state_machine.process_event(invalid_event)
 
         assert state_machine.current_state == ButtonState.IDLE
         assert not actions
 
+    def test_release_in_idle_state_is_ignored(self, state_machine):
+        """Test a release with no preceding press has no transition and no actions."""
+        actions = state_machine.process_event(
+            ButtonEvent(type="release", timestamp_ns=time.monotonic_ns())
+        )
+
+        assert state_machine.current_state == ButtonState.IDLE
+        assert state_machine.press_count == 0
+        assert actions == []
+
     def test_state_reset(self, state_machine):
         """Test manual state reset functionality."""
         # Put machine in a non-idle state
-        press_event = ButtonEvent(type="press", timestamp=datetime.now())
+        press_event = ButtonEvent(type="press", timestamp_ns=time.monotonic_ns())
         state_machine.process_event(press_event)
 
         assert state_machine.current_state == ButtonState.PRESSED
@@ -212,10 +224,10 @@ class TestButtonStateMachine:
     def test_async_action_processing(self, state_machine):
         """Test that actions can be processed asynchronously."""
         # This tests the interface for async action handling
-        press_event = ButtonEvent(type="press", timestamp=datetime.now())
+        press_event = ButtonEvent(type="press", timestamp_ns=time.monotonic_ns())
         state_machine.process_event(press_event)
 
-        release_event = ButtonEvent(type="release", timestamp=datetime.now())
+        release_event = ButtonEvent(type="release", timestamp_ns=time.monotonic_ns())
         actions = state_machine.process_event(release_event)
 
         # Actions should be returned for async processing
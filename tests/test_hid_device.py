@@ -1,12 +1,20 @@
 """Tests for HID device discovery and connection logic."""
 
+import dataclasses
 import io
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, mock_open, patch
 
 import pytest
 
-from muteme_btn.hid.device import DeviceError, DeviceInfo, LEDColor, MuteMeDevice
+from muteme_btn.hid.device import (
+    ENUMERATION_CACHE_TTL_SECONDS,
+    DeviceError,
+    DeviceEvent,
+    DeviceInfo,
+    LEDColor,
+    MuteMeDevice,
+)
 
 
 class TestLEDColor:
@@ -23,6 +31,12 @@ class TestLEDColor:
         assert LEDColor.CYAN.value == 0x06  # Swapped: was PURPLE
         assert LEDColor.WHITE.value == 0x07
 
+    def test_led_color_is_int(self):
+        """Test LED colors combine directly with brightness offsets."""
+        assert isinstance(LEDColor.RED, int)
+        assert LEDColor.RED | 0x10 == 0x11
+        assert bytes([0x00, LEDColor.BLUE]) == bytes([0x00, 0x04])
+
     def test_led_color_from_name(self):
         """Test creating LEDColor from string name."""
         assert LEDColor.from_name("red") == LEDColor.RED
@@ -61,8 +75,17 @@ class TestMuteMeDevice:
         assert device_info.manufacturer == "MuteMe"
         assert device_info.product == "MuteMe Button"
 
+    def test_device_info_is_immutable_and_hashable(self):
+        """Test DeviceInfo is frozen, slotted and usable as a set/dict key."""
+        device_info = DeviceInfo(vendor_id=0x20A0, product_id=0x42DA, path="/dev/hidraw0")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            device_info.path = "/dev/hidraw1"  # type: ignore[misc]
+        assert not hasattr(device_info, "__dict__")
+        assert {device_info, DeviceInfo(0x20A0, 0x42DA, "/dev/hidraw0")} == {device_info}
+
     @patch("hid.enumerate")
-    def test_discover_muteme_devices_found(self, mock_enumerate):
+    def test_discover_muteme_devices_found(self, mock_enumerate, enumerate_by_vendor):
         """Test successful device discovery."""
         # Mock device list from hidapi
         mock_devices = [
@@ -74,7 +97,7 @@ class TestMuteMeDevice:
                 "product_string": "MuteMe Button",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         devices = MuteMeDevice.discover_devices()
 
@@ -84,7 +107,7 @@ class TestMuteMeDevice:
         assert devices[0].path == "/dev/hidraw0"
 
     @patch("hid.enumerate")
-    def test_discover_muteme_devices_multiple_found(self, mock_enumerate):
+    def test_discover_muteme_devices_multiple_found(self, mock_enumerate, enumerate_by_vendor):
         """Test discovery of multiple MuteMe devices."""
         mock_devices = [
             {
@@ -102,7 +125,7 @@ class TestMuteMeDevice:
                 "product_string": "MuteMe Button",
             },
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         devices = MuteMeDevice.discover_devices()
 
@@ -110,8 +133,149 @@ class TestMuteMeDevice:
         assert devices[0].product_id == 0x42DA
         assert devices[1].product_id == 0x42DB
 
+    @patch("muteme_btn.hid.device.logger")
+    @patch("hid.enumerate")
+    def test_discover_logs_found_devices_once(
+        self, mock_enumerate, mock_logger, enumerate_by_vendor
+    ):
+        """Test discovery emits a single batched log line for all found devices."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [
+                {"vendor_id": 0x20A0, "product_id": 0x42DA, "path": b"/dev/hidraw0"},
+                {"vendor_id": 0x20A0, "product_id": 0x42DB, "path": b"/dev/hidraw1"},
+            ]
+        )
+
+        MuteMeDevice.discover_devices()
+
+        mock_logger.info.assert_called_once_with(
+            "Found MuteMe devices",
+            count=2,
+            devices=[("0x20a0", "0x42da", "/dev/hidraw0"), ("0x20a0", "0x42db", "/dev/hidraw1")],
+        )
+
+    def test_is_muteme_device(self):
+        """Test supported VID/PID pairs are recognized and others rejected."""
+        assert MuteMeDevice._is_muteme_device(0x20A0, 0x42DA) is True
+        assert MuteMeDevice._is_muteme_device(0x20A0, 0x42DB) is True
+        assert MuteMeDevice._is_muteme_device(0x3603, 0x0004) is True
+        # PID from the other vendor's family must not match
+        assert MuteMeDevice._is_muteme_device(0x20A0, 0x0001) is False
+        assert MuteMeDevice._is_muteme_device(0x1234, 0x42DA) is False
+
+    @patch("hid.enumerate")
+    def test_discover_filters_by_vendor_in_hidapi(self, mock_enumerate):
+        """Test discovery asks hidapi for MuteMe vendor IDs instead of every device."""
+        mock_enumerate.return_value = []
+
+        MuteMeDevice.discover_devices()
+
+        assert [c.args for c in mock_enumerate.call_args_list] == [
+            (MuteMeDevice.MUTEME_VID, 0),
+            (MuteMeDevice.MINI_VID, 0),
+        ]
+
+    @patch("hid.enumerate")
+    def test_discover_reuses_recent_enumeration(self, mock_enumerate, enumerate_by_vendor):
+        """Test back-to-back discoveries share one bus scan within the cache TTL."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [
+                {"vendor_id": 0x20A0, "product_id": 0x42DA, "path": b"/dev/hidraw0"},
+            ]
+        )
+
+        first = MuteMeDevice.discover_devices()
+        second = MuteMeDevice.discover_devices()
+
+        assert first == second
+        # One scan is one hid.enumerate() call per MuteMe vendor ID
+        assert mock_enumerate.call_count == 2
+
+    @patch("muteme_btn.hid.device.time.monotonic")
     @patch("hid.enumerate")
-    def test_discover_muteme_devices_none_found(self, mock_enumerate):
+    def test_discover_rescans_after_cache_ttl(self, mock_enumerate, mock_monotonic):
+        """Test discovery rescans the bus once cached results are older than the TTL."""
+        mock_enumerate.return_value = []
+        mock_monotonic.side_effect = [100.0, 100.0 + ENUMERATION_CACHE_TTL_SECONDS + 0.1]
+
+        MuteMeDevice.discover_devices()
+        MuteMeDevice.discover_devices()
+
+        # Two scans, each one hid.enumerate() call per MuteMe vendor ID
+        assert mock_enumerate.call_count == 4
+
+    @patch("hid.enumerate")
+    @patch("hid.device")
+    def test_connect_failure_invalidates_enumeration_cache(self, mock_device, mock_enumerate):
+        """Test a failed open forces the next discovery to rescan the bus."""
+        mock_enumerate.return_value = []
+        mock_device.return_value.open_path.side_effect = OSError("open failed")
+
+        MuteMeDevice.discover_devices()
+        with pytest.raises(DeviceError):
+            MuteMeDevice.connect("1-1.4.2.4.2:1.0")
+        MuteMeDevice.discover_devices()
+
+        # Two scans, each one hid.enumerate() call per MuteMe vendor ID
+        assert mock_enumerate.call_count == 4
+
+    @patch("hid.enumerate")
+    @patch("hid.device")
+    def test_connect_does_not_rescan_after_discovery(
+        self, mock_device, mock_enumerate, enumerate_by_vendor
+    ):
+        """Test connect looks up device info from the cached discovery scan."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [
+                {"vendor_id": 0x20A0, "product_id": 0x42DA, "path": b"/dev/hidraw0"},
+            ]
+        )
+
+        MuteMeDevice.discover_devices()
+        device = MuteMeDevice.connect("/dev/hidraw0")
+
+        # One scan is one hid.enumerate() call per MuteMe vendor ID
+        assert mock_enumerate.call_count == 2
+        info = device.get_device_info()
+        assert info is not None
+        assert info.product_id == 0x42DA
+
+    @patch("muteme_btn.hid.device.logger")
+    @patch("hid.enumerate")
+    @patch("hid.device")
+    def test_connect_by_vid_pid_reads_info_from_cache(
+        self, mock_device, mock_enumerate, mock_logger, enumerate_by_vendor
+    ):
+        """Test connect_by_vid_pid describes the device without repeating discovery."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [
+                {
+                    "vendor_id": 0x20A0,
+                    "product_id": 0x42DA,
+                    "path": b"/dev/hidraw0",
+                    "manufacturer_string": "MuteMe",
+                    "product_string": "MuteMe Button",
+                },
+            ]
+        )
+
+        MuteMeDevice.discover_devices()
+        mock_logger.reset_mock()
+        device = MuteMeDevice.connect_by_vid_pid(0x20A0, 0x42DA)
+
+        assert mock_enumerate.call_count == 2
+        assert device.get_device_info() == DeviceInfo(
+            vendor_id=0x20A0,
+            product_id=0x42DA,
+            path="/dev/hidraw0",
+            manufacturer="MuteMe",
+            product="MuteMe Button",
+        )
+        messages = [c.args[0] for c in mock_logger.info.call_args_list]
+        assert "Found MuteMe devices" not in messages
+
+    @patch("hid.enumerate")
+    def test_discover_muteme_devices_none_found(self, mock_enumerate, enumerate_by_vendor):
         """Test no MuteMe devices found."""
         mock_devices = [
             {
@@ -122,14 +286,14 @@ class TestMuteMeDevice:
                 "product_string": "Other Device",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         devices = MuteMeDevice.discover_devices()
 
         assert len(devices) == 0
 
     @patch("hid.enumerate")
-    def test_discover_muteme_devices_with_minis(self, mock_enumerate):
+    def test_discover_muteme_devices_with_minis(self, mock_enumerate, enumerate_by_vendor):
         """Test discovery includes MuteMe Mini variants."""
         mock_devices = [
             {
@@ -140,7 +304,7 @@ class TestMuteMeDevice:
                 "product_string": "MuteMe Mini",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         devices = MuteMeDevice.discover_devices()
 
@@ -150,7 +314,7 @@ class TestMuteMeDevice:
 
     @patch("hid.enumerate")
     @patch("hid.device")
-    def test_connect_to_device_success(self, mock_device, mock_enumerate):
+    def test_connect_to_device_success(self, mock_device, mock_enumerate, enumerate_by_vendor):
         """Test successful device connection."""
         # Mock device discovery
         mock_devices = [
@@ -162,7 +326,7 @@ class TestMuteMeDevice:
                 "product_string": "MuteMe Button",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         # Mock hid.device()
         mock_hid_device = Mock()
@@ -173,6 +337,7 @@ class TestMuteMeDevice:
 
         assert device is not None
         mock_hid_device.open_path.assert_called_once_with(b"/dev/hidraw0")
+        mock_hid_device.set_nonblocking.assert_called_once_with(1)
 
     @patch("hid.device")
     def test_connect_to_device_failure(self, mock_device):
@@ -184,6 +349,40 @@ class TestMuteMeDevice:
         with pytest.raises(DeviceError, match="Failed to connect"):
             MuteMeDevice.connect("/dev/hidraw0")
 
+    @patch("hid.enumerate", return_value=[])
+    @patch("hid.device")
+    def test_connect_closes_handle_when_setup_fails(self, mock_device, mock_enumerate):
+        """Test a failure after open_path() closes the handle instead of leaking it."""
+        mock_hid_device = mock_device.return_value
+        mock_hid_device.set_nonblocking.side_effect = OSError("ioctl failed")
+
+        with pytest.raises(DeviceError, match="Failed to connect"):
+            MuteMeDevice.connect("/dev/hidraw0")
+
+        mock_hid_device.close.assert_called_once()
+
+    @patch("hid.enumerate", return_value=[])
+    @patch("hid.device")
+    def test_connect_by_vid_pid_closes_handle_when_setup_fails(self, mock_device, mock_enumerate):
+        """Test a failure after open() closes the handle instead of leaking it."""
+        mock_hid_device = mock_device.return_value
+        mock_hid_device.set_nonblocking.side_effect = OSError("ioctl failed")
+
+        with pytest.raises(DeviceError, match="Failed to connect"):
+            MuteMeDevice.connect_by_vid_pid(0x20A0, 0x42DA)
+
+        mock_hid_device.close.assert_called_once()
+
+    @patch("hid.device")
+    def test_connect_failure_before_open_closes_nothing(self, mock_device):
+        """Test a failed open_path() does not try to close a handle it never got."""
+        mock_device.return_value.open_path.side_effect = OSError("open failed")
+
+        with pytest.raises(DeviceError):
+            MuteMeDevice.connect("/dev/hidraw0")
+
+        mock_device.return_value.close.assert_not_called()
+
     @patch("muteme_btn.hid.device.logger")
     @patch("hid.device")
     def test_connect_open_failed_logs_warning(self, mock_device, mock_logger):
@@ -289,6 +488,35 @@ class TestMuteMeDevice:
             bytes([0x00, 0x00])
         )  # Report ID 0, Color NOCOLOR
 
+    def test_set_led_color_report_formats(self):
+        """Test each report format produces the expected report bytes."""
+        expected = {
+            "no_report_id": bytes([0x01]),
+            "report_id_0": bytes([0x00, 0x01]),
+            "report_id_2": bytes([0x02, 0x01]),
+            "padded": bytes([0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]),
+            "standard": bytes([0x01, 0x01]),
+        }
+        for report_format, report in expected.items():
+            mock_hid_device = Mock()
+            device = MuteMeDevice(mock_hid_device)
+
+            device.set_led_color(LEDColor.RED, report_format=report_format)
+
+            mock_hid_device.write.assert_called_once_with(report)
+
+    def test_led_reports_are_reused(self):
+        """Test repeated LED updates reuse the same prebuilt report object."""
+        mock_hid_device = Mock()
+        device = MuteMeDevice(mock_hid_device)
+
+        device.set_led_color(LEDColor.GREEN, brightness="dim")
+        device.set_led_color(LEDColor.GREEN, brightness="dim")
+
+        first, second = (c.args[0] for c in mock_hid_device.write.call_args_list)
+        assert first == bytes([0x00, 0x12])
+        assert first is second
+
     def test_set_led_color_not_connected(self):
         """Test setting LED color when device not connected."""
         device = MuteMeDevice(None)
@@ -335,6 +563,133 @@ class TestMuteMeDevice:
         mock_hid_device.close.assert_called_once()
         assert device.is_connected() is False
 
+    def test_read_batch_drains_pending_reports(self):
+        """Test read_batch waits for one report then drains the queue without blocking."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.side_effect = [[0, 0, 0, 1], [0, 0, 0, 0], []]
+        device = MuteMeDevice(mock_hid_device)
+
+        reports = device.read_batch(report_size=4, timeout_ms=10)
+
+        assert reports == [bytes([0, 0, 0, 1]), bytes([0, 0, 0, 0])]
+        assert mock_hid_device.read.call_args_list[0] == call(4, 10)
+        assert mock_hid_device.read.call_args_list[1] == call(4)
+        assert mock_hid_device.set_nonblocking.call_args_list == [call(1), call(0)]
+
+    def test_read_batch_empty_skips_drain(self):
+        """Test read_batch returns nothing and stays blocking when no report arrives."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.return_value = []
+        device = MuteMeDevice(mock_hid_device)
+
+        assert device.read_batch() == []
+        mock_hid_device.read.assert_called_once()
+        mock_hid_device.set_nonblocking.assert_not_called()
+
+    def test_read_batch_respects_max_reports(self):
+        """Test read_batch stops draining at max_reports."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.return_value = [0, 0, 0, 1]
+        device = MuteMeDevice(mock_hid_device)
+
+        reports = device.read_batch(report_size=4, max_reports=3)
+
+        assert len(reports) == 3
+        assert mock_hid_device.read.call_count == 3
+
+    def test_read_batch_failure_disconnects_device(self):
+        """Test read_batch failure closes and disconnects device handle."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.side_effect = [[0, 0, 0, 1], Exception("read error")]
+        device = MuteMeDevice(mock_hid_device)
+
+        with pytest.raises(DeviceError, match="Device read failed"):
+            device.read_batch()
+
+        mock_hid_device.set_nonblocking.assert_called_with(0)
+        mock_hid_device.close.assert_called_once()
+        assert device.is_connected() is False
+
+    def test_read_batch_nonblocking_handle_skips_mode_toggle(self):
+        """Test read_batch drains a non-blocking handle without switching modes."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.side_effect = [[0, 0, 0, 1], []]
+        device = MuteMeDevice(mock_hid_device)
+        device.set_nonblocking(True)
+        mock_hid_device.set_nonblocking.reset_mock()
+
+        reports = device.read_batch(report_size=4, timeout_ms=0)
+
+        assert reports == [bytes([0, 0, 0, 1])]
+        mock_hid_device.set_nonblocking.assert_not_called()
+
+    def test_set_nonblocking_not_connected(self):
+        """Test set_nonblocking fails when device is not connected."""
+        device = MuteMeDevice()
+
+        with pytest.raises(DeviceError, match="Device not connected"):
+            device.set_nonblocking(True)
+
+    @pytest.mark.asyncio
+    async def test_read_events_nonblocking_does_not_wait(self):
+        """Test read_events polls a non-blocking handle with a zero timeout."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.return_value = []
+        device = MuteMeDevice(mock_hid_device)
+        device.set_nonblocking(True)
+
+        assert await device.read_events() == []
+        mock_hid_device.read.assert_called_once_with(4, 0)
+
+    @pytest.mark.asyncio
+    async def test_read_events_returns_all_batched_reports(self):
+        """Test read_events turns every drained report into an event."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.side_effect = [[0, 0, 0, 1], [0, 0, 0, 0], []]
+        device = MuteMeDevice(mock_hid_device)
+
+        events = await device.read_events()
+
+        assert [event.type for event in events] == ["press", "release"]
+        assert all(isinstance(event, DeviceEvent) for event in events)
+
+    @pytest.mark.asyncio
+    async def test_read_events_decodes_press_variants_like_event_handler(self):
+        """Test every press variant byte (0x01-0x04) is a press, matching EventHandler."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.side_effect = [[0, 0, 0, b] for b in range(6)] + [[]]
+        device = MuteMeDevice(mock_hid_device)
+
+        events = await device.read_events()
+
+        assert [event.type for event in events] == ["release"] + ["press"] * 4 + ["release"]
+
+    @patch("muteme_btn.hid.device.is_debug_enabled", return_value=False)
+    @patch("muteme_btn.hid.device.logger")
+    def test_read_write_skip_debug_logging_when_disabled(self, mock_logger, _mock_debug):
+        """Test HID transfers do not build debug log calls unless DEBUG is enabled."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.return_value = [0x00, 0x00, 0x00, 0x01]
+        device = MuteMeDevice(mock_hid_device)
+
+        device.read(4)
+        device.write(bytes([0x00, 0x01]))
+
+        mock_logger.debug.assert_not_called()
+
+    @patch("muteme_btn.hid.device.is_debug_enabled", return_value=True)
+    @patch("muteme_btn.hid.device.logger")
+    def test_read_write_debug_logging_when_enabled(self, mock_logger, _mock_debug):
+        """Test HID transfers emit debug log calls when DEBUG is enabled."""
+        mock_hid_device = Mock()
+        mock_hid_device.read.return_value = [0x00, 0x00, 0x00, 0x01]
+        device = MuteMeDevice(mock_hid_device)
+
+        device.read(4)
+        device.write(bytes([0x00, 0x01]))
+
+        assert mock_logger.debug.call_count == 2
+
     @patch("time.sleep")
     def test_set_led_color_flashing_brightness(self, mock_sleep):
         """Test setting LED color with flashing brightness."""
@@ -424,6 +779,95 @@ class TestMuteMeDevice:
                         assert 'TAG+="uaccess"' in error_msg
                         assert "chmod 666" not in error_msg
 
+    def test_get_device_permissions_error_accessible_device_gets_diagnostic(self):
+        """Test an existing device always gets the full report, never a success message."""
+        with (
+            patch("os.path.exists", return_value=True),
+            patch("os.access", return_value=True),
+            patch("os.stat") as mock_stat,
+            patch("os.getuid", return_value=1000),
+            patch("muteme_btn.hid.device._uid_name", return_value="user"),
+            patch("muteme_btn.hid.device._gid_name", return_value="plugdev"),
+        ):
+            mock_stat.return_value.st_mode = 0o666
+            error_msg = MuteMeDevice.get_device_permissions_error("/dev/hidraw0")
+
+        mock_stat.assert_called_once_with("/dev/hidraw0")
+        assert error_msg.startswith("Cannot access device /dev/hidraw0.")
+        assert "readable and writable" not in error_msg
+
+    def test_get_device_permissions_error_missing_device(self):
+        """Test a missing device gets a short message without the full diagnostic."""
+        with (
+            patch("os.path.exists", return_value=False),
+            patch("os.access") as mock_access,
+            patch("pwd.getpwuid") as mock_pwuid,
+        ):
+            error_msg = MuteMeDevice.get_device_permissions_error("/dev/hidraw9")
+
+        assert error_msg == "Device /dev/hidraw9 not found"
+        mock_access.assert_not_called()
+        mock_pwuid.assert_not_called()
+
+    def test_get_device_permissions_error_caches_name_lookups(self):
+        """Test that owner and current user names are resolved once per ID."""
+        with (
+            # An existing, inaccessible node is what reaches the stat diagnostic
+            patch("os.path.exists", return_value=True),
+            patch("os.access", return_value=False),
+            patch("os.stat") as mock_stat,
+            patch("os.getuid", return_value=1000),
+            patch("pwd.getpwuid") as mock_pwuid,
+            patch("grp.getgrgid") as mock_grgid,
+        ):
+            mock_stat.return_value.st_mode = 0o660
+            mock_stat.return_value.st_uid = 0
+            mock_stat.return_value.st_gid = 46
+            mock_pwuid.return_value.pw_name = "user"
+            mock_grgid.return_value.gr_name = "plugdev"
+
+            MuteMeDevice.get_device_permissions_error("/dev/hidraw0")
+            MuteMeDevice.get_device_permissions_error("/dev/hidraw0")
+
+        # One lookup each for the owner (0) and the current user (1000)
+        assert mock_pwuid.call_count == 2
+        mock_grgid.assert_called_once_with(46)
+
+    @patch("glob.glob")
+    @patch("hid.enumerate")
+    def test_find_hidraw_device_uses_cached_enumeration(
+        self, mock_enumerate, mock_glob, enumerate_by_vendor
+    ):
+        """Test a hidraw path from the discovery scan is returned without a sysfs scan."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [{"vendor_id": 0x20A0, "product_id": 0x42DA, "path": b"/dev/hidraw3"}]
+        )
+
+        MuteMeDevice.discover_devices()
+        hidraw_path = MuteMeDevice._find_hidraw_device(0x20A0, 0x42DA)
+
+        assert hidraw_path == "/dev/hidraw3"
+        # Served from the discovery scan: one hid.enumerate() call per MuteMe vendor ID
+        assert mock_enumerate.call_count == 2
+        mock_glob.assert_not_called()
+
+    @patch("glob.glob", return_value=["/dev/hidraw0"])
+    @patch("hid.enumerate")
+    def test_find_hidraw_device_falls_back_to_sysfs_for_libusb_paths(
+        self, mock_enumerate, mock_glob, enumerate_by_vendor
+    ):
+        """Test a libusb-style enumeration path falls back to the sysfs uevent scan."""
+        mock_enumerate.side_effect = enumerate_by_vendor(
+            [{"vendor_id": 0x20A0, "product_id": 0x42DA, "path": b"1-1.4:1.0"}]
+        )
+        uevent = "HID_ID=0003:000020A0:000042DA\n"
+
+        with patch("builtins.open", mock_open(read_data=uevent)):
+            hidraw_path = MuteMeDevice._find_hidraw_device(0x20A0, 0x42DA)
+
+        assert hidraw_path == "/dev/hidraw0"
+        mock_glob.assert_called_once_with("/dev/hidraw*")
+
     def test_find_usb_device_node_success(self):
         """Test finding USB device node for matching VID/PID."""
         sysfs_root = "/sys/bus/usb/devices"
@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from muteme_btn.hid.events import ButtonEvent, ButtonState, EventHandler
 
 
@@ -11,11 +13,14 @@ class TestButtonEvent:
     def test_button_event_creation(self):
         """Test ButtonEvent creation."""
         event = ButtonEvent(
-            state=ButtonState.PRESSED, timestamp=1234567890.123, device_path="/dev/hidraw0"
+            state=ButtonState.PRESSED,
+            timestamp_ns=1_234_567_890_123_000_000,
+            device_path="/dev/hidraw0",
         )
 
         assert event.state == ButtonState.PRESSED
-        assert event.timestamp == 1234567890.123
+        assert event.timestamp_ns == 1_234_567_890_123_000_000
+        assert event.timestamp == pytest.approx(1234567890.123)
         assert event.device_path == "/dev/hidraw0"
         assert event.is_press is True
         assert event.is_release is False
@@ -23,7 +28,9 @@ class TestButtonEvent:
     def test_button_event_release(self):
         """Test ButtonEvent for release state."""
         event = ButtonEvent(
-            state=ButtonState.RELEASED, timestamp=1234567890.123, device_path="/dev/hidraw0"
+            state=ButtonState.RELEASED,
+            timestamp_ns=1_234_567_890_123_000_000,
+            device_path="/dev/hidraw0",
         )
 
         assert event.state == ButtonState.RELEASED
@@ -117,10 +124,10 @@ class TestEventHandler:
         event = callback.call_args[0][0]
         assert event.state == ButtonState.PRESSED
 
-    @patch("time.time")
-    def test_process_hid_data_timestamp(self, mock_time):
-        """Test that event timestamp is set correctly."""
-        mock_time.return_value = 1234567890.5
+    @patch("time.monotonic_ns")
+    def test_process_hid_data_timestamp(self, mock_monotonic_ns):
+        """Test that event timestamp is taken from the monotonic clock."""
+        mock_monotonic_ns.return_value = 1_234_567_890_500_000_000
 
         handler = EventHandler("/dev/hidraw0")
         callback = Mock()
@@ -129,7 +136,20 @@ class TestEventHandler:
         handler.process_hid_data(b"\x01")
 
         event = callback.call_args[0][0]
-        assert event.timestamp == 1234567890.5
+        assert event.timestamp_ns == 1_234_567_890_500_000_000
+        assert event.timestamp == pytest.approx(1234567890.5)
+
+    @pytest.mark.parametrize("button_byte", [0x01, 0x02, 0x03, 0x04])
+    def test_process_hid_data_press_variants(self, button_byte):
+        """Test that all press variant bytes decode as PRESSED."""
+        handler = EventHandler("/dev/hidraw0")
+        callback = Mock()
+        handler.set_event_callback(callback)
+
+        handler.process_hid_data(bytes([button_byte]))
+
+        event = callback.call_args[0][0]
+        assert event.state == ButtonState.PRESSED
 
     def test_process_hid_data_unknown_button_value(self):
         """Test processing unknown button values."""
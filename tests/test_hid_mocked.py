@@ -11,8 +11,8 @@ from muteme_btn.hid.events import ButtonEvent, ButtonState, EventHandler
 class TestMockedHIDIntegration:
     """Integration tests with fully mocked HID layer for CI environments."""
 
-    @patch("muteme_btn.hid.device.hid.enumerate")
-    def test_full_device_discovery_workflow(self, mock_enumerate):
+    @patch("hid.enumerate")
+    def test_full_device_discovery_workflow(self, mock_enumerate, enumerate_by_vendor):
         """Test complete device discovery workflow with mocked devices."""
         # Mock multiple MuteMe devices
         mock_devices = [
@@ -38,7 +38,7 @@ class TestMockedHIDIntegration:
                 "product_string": "Other Device",
             },
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         # Discover devices
         devices = MuteMeDevice.discover_devices()
@@ -49,9 +49,11 @@ class TestMockedHIDIntegration:
         assert devices[0].product == "MuteMe Button"
         assert devices[1].product == "MuteMe Mini"
 
-    @patch("muteme_btn.hid.device.hid.enumerate")
-    @patch("muteme_btn.hid.device.hid.device")
-    def test_full_connection_and_led_workflow(self, mock_device_class, mock_enumerate):
+    @patch("hid.enumerate")
+    @patch("hid.device")
+    def test_full_connection_and_led_workflow(
+        self, mock_device_class, mock_enumerate, enumerate_by_vendor
+    ):
         """Test complete connection and LED control workflow."""
         # Mock device discovery
         mock_devices = [
@@ -63,7 +65,7 @@ class TestMockedHIDIntegration:
                 "product_string": "MuteMe Button",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         # Mock device instance
         mock_device = Mock()
@@ -89,9 +91,11 @@ class TestMockedHIDIntegration:
         device.disconnect()
         mock_device.close.assert_called_once()
 
-    @patch("muteme_btn.hid.device.hid.enumerate")
-    @patch("muteme_btn.hid.device.hid.device")
-    def test_full_event_handling_workflow(self, mock_device_class, mock_enumerate):
+    @patch("hid.enumerate")
+    @patch("hid.device")
+    def test_full_event_handling_workflow(
+        self, mock_device_class, mock_enumerate, enumerate_by_vendor
+    ):
         """Test complete event handling workflow."""
         # Mock device discovery
         mock_devices = [
@@ -103,7 +107,7 @@ class TestMockedHIDIntegration:
                 "product_string": "MuteMe Button",
             }
         ]
-        mock_enumerate.return_value = mock_devices
+        mock_enumerate.side_effect = enumerate_by_vendor(mock_devices)
 
         # Mock device instance
         mock_device = Mock()
@@ -134,7 +138,7 @@ class TestMockedHIDIntegration:
     def test_error_handling_workflow(self):
         """Test error handling in various failure scenarios."""
         # Test connection failure
-        with patch("muteme_btn.hid.device.hid.device") as mock_device_class:
+        with patch("hid.device") as mock_device_class:
             mock_device = Mock()
             mock_device_class.return_value = mock_device
             mock_device.open_path.side_effect = Exception("Permission denied")
@@ -222,7 +226,7 @@ class TestMockedCIEnvironment:
         # actual MuteMe hardware to be connected
 
         # Test device discovery (returns empty list when no devices)
-        with patch("muteme_btn.hid.device.hid.enumerate", return_value=[]):
+        with patch("hid.enumerate", return_value=[]):
             devices = MuteMeDevice.discover_devices()
             assert devices == []
 
@@ -232,7 +236,9 @@ class TestMockedCIEnvironment:
 
         # Test event creation
         event = ButtonEvent(
-            state=ButtonState.PRESSED, timestamp=1234567890.0, device_path="/dev/hidraw0"
+            state=ButtonState.PRESSED,
+            timestamp_ns=1_234_567_890_000_000_000,
+            device_path="/dev/hidraw0",
         )
         assert event.is_press is True
 
@@ -244,8 +250,8 @@ class TestMockedCIEnvironment:
         """Test that all components can be fully mocked."""
         # Mock the entire HID stack
         with (
-            patch("muteme_btn.hid.device.hid.enumerate") as mock_enumerate,
-            patch("muteme_btn.hid.device.hid.device") as mock_device_class,
+            patch("hid.enumerate") as mock_enumerate,
+            patch("hid.device") as mock_device_class,
         ):
             # Setup mocks
             mock_enumerate.return_value = []
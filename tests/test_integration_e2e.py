@@ -1,7 +1,7 @@
 """End-to-end integration tests for the complete MuteMe button control system."""
 
 import asyncio
-from datetime import datetime, timedelta
+import time
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -13,13 +13,17 @@ from muteme_btn.core.led_feedback import LEDFeedbackController
 from muteme_btn.core.state import ButtonStateMachine
 from muteme_btn.hid.device import LEDColor
 
+_MS = 1_000_000  # nanoseconds per millisecond
+
+pytestmark = pytest.mark.slow
+
 
 class MockButtonEvent:
     """Mock button event for testing."""
 
-    def __init__(self, event_type: str, timestamp: datetime):
+    def __init__(self, event_type: str, timestamp_ns: int):
         self.type = event_type
-        self.timestamp = timestamp
+        self.timestamp_ns = timestamp_ns
 
 
 class MockHIDDevice:
@@ -60,11 +64,11 @@ class MockHIDDevice:
         """Get current LED color."""
         return self._led_color
 
-    def add_event(self, event_type: str, timestamp: datetime | None = None) -> None:
+    def add_event(self, event_type: str, timestamp_ns: int | None = None) -> None:
         """Add a button event."""
-        if timestamp is None:
-            timestamp = datetime.now()
-        self._events.append(MockButtonEvent(event_type, timestamp))
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        self._events.append(MockButtonEvent(event_type, timestamp_ns))
 
     def close(self) -> None:
         """Close device."""
@@ -164,9 +168,9 @@ class TestEndToEndIntegration:
         assert mock_device.get_led_color() == LEDColor.GREEN
 
         # Simulate button press and release
-        press_time = datetime.now()
+        press_time = time.monotonic_ns()
         mock_device.add_event("press", press_time)
-        mock_device.add_event("release", press_time + timedelta(milliseconds=50))
+        mock_device.add_event("release", press_time + 50 * _MS)
 
         # Wait for processing
         await asyncio.sleep(0.05)
@@ -289,11 +293,11 @@ class TestEndToEndIntegration:
         assert mock_audio_backend.is_muted() is False
 
         # Simple double tap: two complete press-release cycles
-        base_time = datetime.now()
+        base_time = time.monotonic_ns()
 
         # First press-release
         mock_device.add_event("press", base_time)
-        mock_device.add_event("release", base_time + timedelta(milliseconds=50))
+        mock_device.add_event("release", base_time + 50 * _MS)
 
         # Wait for first toggle
         await asyncio.sleep(0.05)
@@ -302,8 +306,8 @@ class TestEndToEndIntegration:
         assert mock_audio_backend.is_muted() is True
 
         # Second press-release (double tap)
-        mock_device.add_event("press", base_time + timedelta(milliseconds=200))
-        mock_device.add_event("release", base_time + timedelta(milliseconds=250))
+        mock_device.add_event("press", base_time + 200 * _MS)
+        mock_device.add_event("release", base_time + 250 * _MS)
 
         # Wait for second toggle
         await asyncio.sleep(0.05)
@@ -346,6 +350,8 @@ class TestEndToEndIntegration:
 
         # Mock startup pattern to avoid delays
         integration_daemon._show_startup_pattern = AsyncMock()
+        # External mute changes below land every 20ms; re-read PulseAudio on every tick
+        integration_daemon._mute_cache_ttl_ns = 0
 
         daemon_task = asyncio.create_task(integration_daemon.start())
         await asyncio.sleep(0.05)  # Wait for initialization
@@ -391,10 +397,10 @@ class TestEndToEndIntegration:
         await asyncio.sleep(0.01)
 
         # Add multiple events rapidly
-        base_time = datetime.now()
+        base_time = time.monotonic_ns()
         for i in range(5):
-            mock_device.add_event("press", base_time + timedelta(milliseconds=i * 10))
-            mock_device.add_event("release", base_time + timedelta(milliseconds=i * 10 + 5))
+            mock_device.add_event("press", base_time + i * 10 * _MS)
+            mock_device.add_event("release", base_time + (i * 10 + 5) * _MS)
 
         await asyncio.sleep(0.1)
 
@@ -67,6 +67,13 @@ class TestLEDFeedbackController:
 
         led_controller.device.set_led_color.assert_called_once_with(LEDColor.RED)
 
+    def test_update_led_with_known_mute_state(self, led_controller, mock_audio_backend):
+        """Test a caller-supplied mute state skips the audio backend query."""
+        led_controller.update_led_to_mute_status(True)
+
+        mock_audio_backend.is_muted.assert_not_called()
+        led_controller.device.set_led_color.assert_called_once_with(LEDColor.RED)
+
     def test_update_led_skips_duplicate_color_updates(self, led_controller, mock_audio_backend):
         """Test duplicate LED writes are skipped when color is unchanged."""
         mock_audio_backend.is_muted.return_value = False
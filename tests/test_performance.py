@@ -2,7 +2,6 @@
 
 import asyncio
 import time
-from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -12,6 +11,10 @@ from muteme_btn.core.daemon import MuteMeDaemon
 from muteme_btn.core.led_feedback import LEDFeedbackController
 from muteme_btn.core.state import ButtonEvent, ButtonStateMachine
 
+_MS = 1_000_000  # nanoseconds per millisecond
+
+pytestmark = pytest.mark.slow
+
 
 class MockPerformanceDevice:
     """Mock device for performance testing."""
@@ -46,10 +49,10 @@ class MockPerformanceDevice:
         end_time = time.perf_counter()
         self._operation_times.append(end_time - start_time)
 
-    def add_event(self, event_type, timestamp=None):
-        if timestamp is None:
-            timestamp = datetime.now()
-        self._events.append(Mock(type=event_type, timestamp=timestamp))
+    def add_event(self, event_type, timestamp_ns=None):
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        self._events.append(Mock(type=event_type, timestamp_ns=timestamp_ns))
 
     def get_operation_times(self):
         return self._operation_times.copy()
@@ -314,8 +317,8 @@ class TestPerformanceMeasurement:
 
         # Process many events
         for _i in range(1000):
-            press_event = ButtonEvent("press", datetime.now())
-            release_event = ButtonEvent("release", datetime.now() + timedelta(milliseconds=10))
+            press_event = ButtonEvent("press", time.monotonic_ns())
+            release_event = ButtonEvent("release", time.monotonic_ns() + 10 * _MS)
 
             state_machine.process_event(press_event)
             state_machine.process_event(release_event)
@@ -373,7 +376,7 @@ class TestPerformanceMeasurement:
 
         while time.time() - start_time < 0.1:  # Run for 100ms
             for _i in range(100):
-                event = ButtonEvent("press", datetime.now())
+                event = ButtonEvent("press", time.monotonic_ns())
                 state_machine.process_event(event)
             time.sleep(0.001)  # Small delay
 
@@ -8,7 +8,15 @@ from unittest.mock import patch
 
 import structlog
 
-from muteme_btn.utils.logging import LogContext, get_logger, log_with_context, setup_logging
+from muteme_btn.utils.logging import (
+    LazyLogger,
+    LogContext,
+    get_logger,
+    is_debug_enabled,
+    log_with_context,
+    refresh_log_level,
+    setup_logging,
+)
 
 
 class TestSetupLogging:
@@ -204,6 +212,55 @@ class TestSetupLogging:
                 # If not JSON, that's okay - might be text format
                 pass
 
+    def test_setup_logging_reuses_processor_chain(self):
+        """Test repeated setup with the same format reuses the built processors."""
+        logging.root.handlers = []
+        structlog.reset_defaults()
+
+        setup_logging(format_type="json")
+        first = structlog.get_config()["processors"]
+        setup_logging(format_type="json")
+        second = structlog.get_config()["processors"]
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+class TestDebugFlag:
+    """Test suite for the cached DEBUG-enabled flag."""
+
+    def test_setup_logging_debug_sets_flag(self):
+        """Test setup_logging at DEBUG level enables the cached flag."""
+        logging.root.handlers = []
+        structlog.reset_defaults()
+
+        setup_logging(level="DEBUG")
+
+        assert is_debug_enabled() is True
+
+    def test_setup_logging_info_clears_flag(self):
+        """Test setup_logging at INFO level disables the cached flag."""
+        logging.root.handlers = []
+        structlog.reset_defaults()
+
+        setup_logging(level="INFO")
+
+        assert is_debug_enabled() is False
+
+    def test_refresh_log_level_tracks_level_changes(self):
+        """Test refresh_log_level picks up level changes made after setup."""
+        logging.root.handlers = []
+        structlog.reset_defaults()
+        setup_logging(level="INFO")
+
+        logging.getLogger().setLevel(logging.DEBUG)
+        try:
+            assert refresh_log_level() is True
+            assert is_debug_enabled() is True
+        finally:
+            logging.getLogger().setLevel(logging.INFO)
+            refresh_log_level()
+
 
 class TestGetLogger:
     """Test suite for get_logger function."""
@@ -250,6 +307,22 @@ class TestGetLogger:
         logger.error("error message")
 
 
+class TestLazyLogger:
+    """Test suite for LazyLogger proxy."""
+
+    def test_lazy_logger_resolves_on_first_use(self):
+        """Test that the structlog logger is only created when first used."""
+        with patch("muteme_btn.utils.logging.get_logger") as mock_get_logger:
+            logger = LazyLogger("test")
+            mock_get_logger.assert_not_called()
+
+            logger.info("first")
+            logger.info("second")
+
+        mock_get_logger.assert_called_once_with("test")
+        assert mock_get_logger.return_value.info.call_count == 2
+
+
 class TestLogContext:
     """Test suite for LogContext context manager."""
 